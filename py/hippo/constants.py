@@ -41,3 +41,10 @@ CONTENT_MATCH_THRESHOLD = 0.4
 
 SITUATION_MATCH_THRESHOLD = 0.4
 """Minimum situation relevance score to consider a match."""
+
+# Search caching
+EMBEDDING_CACHE_SIZE = 4096
+"""Maximum number of text embeddings kept in the searcher's LRU cache."""
+
+SIMILARITY_CACHE_SIZE = 16384
+"""Maximum number of pairwise text similarities kept in the searcher's LRU cache."""
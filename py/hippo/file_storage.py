@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 import aiofiles
+import orjson
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
@@ -27,6 +29,24 @@ CACHE_REFRESH_INTERVAL_SECONDS = 30
 # 💡: Debounce window for file events to avoid excessive cache rebuilds during rapid changes
 FILE_EVENT_DEBOUNCE_SECONDS = 1.0
 
+# 💡: Threads reading insight files during a full rescan - overlaps per-file I/O latency
+# on a cold page cache, while parsing stays on the scanning thread
+REFRESH_READ_WORKERS = 8
+
+
+def _read_bytes(path: str) -> Union[bytes, OSError]:
+    """Read a file, returning any error instead of raising it so a batch keeps going."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        return e
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
 
 class FileBasedStorage:
     """
@@ -57,6 +77,31 @@ class FileBasedStorage:
         self._insights_cache: Dict[str, Insight] = {}
         self._cache_loaded = False
         
+        # 💡: Snapshot of the cache values handed out by get_all_insights, rebuilt only
+        # when the cache changes so repeated tool calls don't copy the whole corpus
+        self._insights_list: Optional[List[Insight]] = None
+
+        # 💡: Trigram -> UUID posting sets over the lowercased content and situation
+        # text. Any substring match contains every trigram of the query, so
+        # search_insights only verifies insights in the intersection of the query's
+        # postings. Built on the first search and dropped whenever the cache is rebuilt
+        # from disk.
+        self._trigram_index: Optional[Dict[str, Set[str]]] = None
+        self._indexed_trigrams: Dict[str, FrozenSet[str]] = {}
+
+        # 💡: mtime of the insights directory as of our last refresh or write. Creating,
+        # renaming or deleting an insight file bumps it, so a cheap stat() catches
+        # changes made by other processes even when watchdog events are dropped.
+        self._insights_dir_mtime_ns: Optional[int] = None
+
+        # 💡: Bumped by every write to the cache, so a rescan running outside the lock
+        # can tell whether its snapshot missed one
+        self._cache_generation = 0
+
+        # 💡: In-flight rescan triggered by a read, so concurrent readers that find the
+        # cache stale wait on one scan instead of each queueing another on _cache_lock
+        self._refresh_future: Optional[asyncio.Future[None]] = None
+
         # Metadata cache (active day counter, etc.)
         self._metadata_cache: Optional[Dict[str, Any]] = None
         
@@ -103,6 +148,16 @@ class FileBasedStorage:
         return self.insights_dir / f"{uuid}.json"
     
     async def _atomic_write_json(self, file_path: Path, data: Dict[str, Any]) -> None:
+        """
+        Atomically write JSON data to a file without blocking the event loop.
+
+        Args:
+            file_path: Target file path
+            data: Dictionary to write as JSON
+        """
+        await asyncio.to_thread(self._atomic_write_json_sync, file_path, data)
+
+    def _atomic_write_json_sync(self, file_path: Path, data: Dict[str, Any]) -> None:
         """
         Atomically write JSON data to a file using temp file + rename.
         
@@ -122,8 +177,8 @@ class FileBasedStorage:
         
         try:
             # Write to temporary file
-            with os.fdopen(temp_fd, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
             
             # Atomic rename
             os.replace(temp_path, file_path)
@@ -135,6 +190,20 @@ class FileBasedStorage:
                 pass
             raise
     
+    async def connect(self) -> None:
+        """
+        Load insights and metadata up front for a server session.
+
+        💡: Warming the cache here keeps the full directory scan out of the first tool
+        call
+        """
+        await self._load_insights_cache()
+        await self._load_metadata()
+
+    async def disconnect(self) -> None:
+        """Stop file watching at the end of a server session."""
+        self.shutdown()
+
     async def _load_metadata(self) -> Dict[str, Any]:
         """Load metadata (active day counter, etc.) from metadata file."""
         if self._metadata_cache is not None:
@@ -150,10 +219,10 @@ class FileBasedStorage:
             return self._metadata_cache
         
         try:
-            async with aiofiles.open(self.metadata_file, 'r') as f:
+            async with aiofiles.open(self.metadata_file, 'rb') as f:
                 content = await f.read()
-                self._metadata_cache = json.loads(content)
-        except (json.JSONDecodeError, OSError) as e:
+                self._metadata_cache = orjson.loads(content)
+        except (orjson.JSONDecodeError, OSError) as e:
             # If corrupted, start fresh but backup
             backup_path = self.metadata_file.with_suffix('.json.backup')
             if self.metadata_file.exists():
@@ -181,11 +250,59 @@ class FileBasedStorage:
         💡: Now delegates to the refresh mechanism for consistency with file watching
         """
         with self._cache_lock:
-            if self._cache_loaded:
+            dir_mtime_ns = self._get_insights_dir_mtime_ns()
+            if self._cache_loaded and self._insights_dir_mtime_ns == dir_mtime_ns:
                 return
-            
-            # Use the same refresh logic as file watching for consistency
-            self._refresh_cache_from_disk()
+
+        # Use the same refresh logic as file watching for consistency.
+        # 💡: A full rescan reads every insight file, so run it in a worker thread to
+        # keep other tool calls moving; it only takes _cache_lock to swap in the new
+        # cache.
+        future = self._refresh_future
+        if future is None:
+            future = self._refresh_future = asyncio.ensure_future(
+                asyncio.to_thread(self._refresh_cache_from_disk)
+            )
+            future.add_done_callback(self._clear_refresh_future)
+        # Shield the shared scan so one cancelled reader doesn't cancel it for all
+        await asyncio.shield(future)
+
+    def _clear_refresh_future(self, future: asyncio.Future[None]) -> None:
+        """Forget a finished rescan so the next stale read starts a new one."""
+        self._refresh_future = None
+
+    def _get_insights_dir_mtime_ns(self) -> Optional[int]:
+        """Get the insights directory mtime, or None if it can't be read."""
+        try:
+            return self.insights_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached insights and metadata so the next read reloads them from disk.
+
+        💡: The directory mtime check catches files being added, replaced or removed,
+        but not a file edited in place (e.g. by hand); this is the escape hatch for
+        that.
+        """
+        with self._cache_lock:
+            self._cache_loaded = False
+            self._insights_list = None
+            self._trigram_index = None
+            self._metadata_cache = None
+
+    def _note_own_write(self) -> None:
+        """
+        Record that the cache reflects a change we just made on disk.
+
+        Invalidates the snapshot list and resyncs the directory mtime so our own
+        writes don't trigger a full refresh on the next read.
+        """
+        with self._cache_lock:
+            self._insights_list = None
+            self._insights_dir_mtime_ns = self._get_insights_dir_mtime_ns()
+            self._cache_generation += 1
     
     async def get_insight(self, uuid: UUID) -> Optional[Insight]:
         """
@@ -212,23 +329,60 @@ class FileBasedStorage:
         Returns:
             UUID string of the stored insight
         """
-        await self._load_insights_cache()
+        uuids = await self.store_insights([insight])
+        return uuids[0]
+
+    async def store_insights(self, insights: List[Insight]) -> List[str]:
+        """
+        Store several insights to disk and update the cache once.
         
-        uuid_str = str(insight.uuid)
-        file_path = self._get_insight_path(insight.uuid)
+        💡: Each insight still gets its own atomic file write, but the cache load,
+        lock acquisition and snapshot invalidation happen once per batch.
         
-        # Mark as written to avoid unnecessary cache refresh on our own change
-        self._mark_uuid_as_written(uuid_str)
+        Args:
+            insights: Insights to store
+
+        Returns:
+            UUID strings of the stored insights, in order
+        """
+        await self._load_insights_cache()
         
-        # Write to disk atomically
-        insight_data = insight.model_dump(mode='json')
-        await self._atomic_write_json(file_path, insight_data)
+        # 💡: One worker-thread hop for the whole batch rather than one per file
+        uuid_strs = await asyncio.to_thread(self._write_insight_files, insights)
         
         # Update cache
         with self._cache_lock:
-            self._insights_cache[uuid_str] = insight
+            for uuid_str, insight in zip(uuid_strs, insights, strict=True):
+                self._insights_cache[uuid_str] = insight
+                self._index_insight(uuid_str, insight)
+            self._note_own_write()
         
-        return uuid_str
+        return uuid_strs
+
+    def _write_insight_files(self, insights: List[Insight]) -> List[str]:
+        """
+        Write each insight to its own file atomically.
+
+        Args:
+            insights: Insights to write
+
+        Returns:
+            UUID strings of the written insights, in order
+        """
+        uuid_strs = []
+        for insight in insights:
+            uuid_str = insight.uuid_str
+
+            # Mark as written to avoid unnecessary cache refresh on our own change
+            self._mark_uuid_as_written(uuid_str)
+
+            # Write to disk atomically
+            insight_data = insight.model_dump(mode='json')
+            insight_path = self._get_insight_path(insight.uuid)
+            self._atomic_write_json_sync(insight_path, insight_data)
+            uuid_strs.append(uuid_str)
+
+        return uuid_strs
     
     async def update_insight(self, uuid: UUID, updates: Dict[str, Any]) -> bool:
         """
@@ -282,30 +436,37 @@ class FileBasedStorage:
             
             # Remove from cache
             del self._insights_cache[uuid_str]
+            self._unindex_insight(uuid_str)
         
         # Mark as written to avoid unnecessary cache refresh on our own change
         self._mark_uuid_as_written(uuid_str)
         
         # Remove file if it exists
         try:
-            file_path.unlink()
+            await asyncio.to_thread(file_path.unlink)
         except OSError:
             # File might not exist, that's okay
             pass
         
+        self._note_own_write()
         return True
     
     async def get_all_insights(self) -> List[Insight]:
         """
         Get all insights from storage.
         
+        The returned list is a shared snapshot that is rebuilt whenever the
+        cache changes - callers must not mutate it.
+
         Returns:
             List of all insights
         """
         await self._load_insights_cache()
         
         with self._cache_lock:
-            return list(self._insights_cache.values())
+            if self._insights_list is None:
+                self._insights_list = list(self._insights_cache.values())
+            return self._insights_list
     
     async def search_insights(self, query: str, filters: Optional[Dict[str, Any]] = None) -> List[Insight]:
         """
@@ -318,28 +479,95 @@ class FileBasedStorage:
         Returns:
             List of matching insights
         """
-        insights = await self.get_all_insights()
+        await self._load_insights_cache()
         
-        # Simple text search implementation
-        # 💡: This is a basic implementation - in production we might want
-        # more sophisticated search with indexing, stemming, etc.
         query_lower = query.lower()
-        results = []
         
-        for insight in insights:
+        with self._cache_lock:
+            if len(query_lower) < 3:
+                # Too short to have a trigram; every insight is a candidate
+                candidates = list(self._insights_cache.values())
+            else:
+                index = self._trigram_index
+                if index is None:
+                    index = self._build_trigram_index()
+
+                # Intersect from the rarest trigram to keep the working set small
+                postings = sorted(
+                    (index.get(trigram, set()) for trigram in _trigrams(query_lower)),
+                    key=len,
+                )
+                matches = postings[0].intersection(*postings[1:])
+                # Walk the cache rather than the set so results keep the cache's order
+                candidates = [
+                    insight for uuid_str, insight in self._insights_cache.items()
+                    if uuid_str in matches
+                ]
+
+        # The index only narrows the candidates; confirm the substring actually occurs
+        results = []
+        for insight in candidates:
             # Search in content
             if query_lower in insight.content.lower():
                 results.append(insight)
                 continue
             
             # Search in situation
-            for situation_item in insight.situation:
-                if query_lower in situation_item.lower():
+            for situation_item in insight.situation_lower:
+                if query_lower in situation_item:
                     results.append(insight)
                     break
         
         return results
     
+    def _insight_trigrams(self, insight: Insight) -> FrozenSet[str]:
+        """Collect the trigrams of an insight's lowercased content and situation."""
+        trigrams = _trigrams(insight.content.lower())
+        for situation_item in insight.situation_lower:
+            trigrams |= _trigrams(situation_item)
+        return frozenset(trigrams)
+
+    def _build_trigram_index(self) -> Dict[str, Set[str]]:
+        """Index every cached insight. Caller must hold _cache_lock."""
+        index, self._indexed_trigrams = self._index_insights(self._insights_cache)
+        self._trigram_index = index
+        return index
+
+    def _index_insights(
+        self, insights: Dict[str, Insight]
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, FrozenSet[str]]]:
+        """Build trigram postings and per-insight trigrams for the given insights."""
+        index: Dict[str, Set[str]] = {}
+        indexed_trigrams: Dict[str, FrozenSet[str]] = {}
+        for uuid_str, insight in insights.items():
+            trigrams = self._insight_trigrams(insight)
+            for trigram in trigrams:
+                index.setdefault(trigram, set()).add(uuid_str)
+            indexed_trigrams[uuid_str] = trigrams
+        return index, indexed_trigrams
+
+    def _index_insight(self, uuid_str: str, insight: Insight) -> None:
+        """Add or replace an insight's postings. Caller must hold _cache_lock."""
+        if self._trigram_index is None:
+            return
+
+        self._unindex_insight(uuid_str)
+        trigrams = self._insight_trigrams(insight)
+        for trigram in trigrams:
+            self._trigram_index.setdefault(trigram, set()).add(uuid_str)
+        self._indexed_trigrams[uuid_str] = trigrams
+
+    def _unindex_insight(self, uuid_str: str) -> None:
+        """Remove an insight's postings, if indexed. Caller must hold _cache_lock."""
+        if self._trigram_index is None:
+            return
+
+        for trigram in self._indexed_trigrams.pop(uuid_str, frozenset()):
+            postings = self._trigram_index[trigram]
+            postings.discard(uuid_str)
+            if not postings:
+                del self._trigram_index[trigram]
+
     async def get_current_active_day(self) -> int:
         """
         Get the current active day, incrementing counter if this is a new calendar day.
@@ -380,6 +608,29 @@ class FileBasedStorage:
             insight.record_access(current_active_day)
             await self.store_insight(insight)
     
+    async def record_insight_accesses(
+        self, uuids: List[UUID], current_active_day: Optional[int] = None
+    ) -> None:
+        """
+        Record accesses to several insights with a single batched write.
+
+        Args:
+            uuids: UUIDs of the accessed insights
+            current_active_day: Day the accesses happened on (default: today's)
+        """
+        if current_active_day is None:
+            current_active_day = await self.get_current_active_day()
+
+        accessed = []
+        for uuid in uuids:
+            insight = await self.get_insight(uuid)
+            if insight is not None:
+                insight.record_access(current_active_day)
+                accessed.append(insight)
+
+        if accessed:
+            await self.store_insights(accessed)
+
     # Compatibility methods to match the existing JsonStorage interface
     async def load(self) -> HippoStorage:
         """
@@ -504,54 +755,97 @@ class FileBasedStorage:
         
         💡: This is our core cache refresh operation - rebuilds everything from disk
         to handle missed events and ensure consistency across processes.
+
+        The scan, parse and indexing run without _cache_lock, which event-loop code
+        takes synchronously; the lock is only held to swap the results in.
         """
         with self._cache_lock:
-            try:
-                # Clear current cache
-                old_cache = self._insights_cache.copy()
-                self._insights_cache.clear()
-                
-                # Scan insights directory for JSON files
-                if not self.insights_dir.exists():
-                    self._cache_loaded = True
-                    logger.debug("Insights directory does not exist, cache refresh complete")
-                    return
+            generation = self._cache_generation
+
+        try:
+            # Read the mtime before scanning so changes made mid-scan trigger another
+            # refresh
+            dir_mtime_ns = self._get_insights_dir_mtime_ns()
+            new_cache = self._read_insights_from_disk()
+            new_list = list(new_cache.values())
+            new_index, new_indexed_trigrams = self._index_insights(new_cache)
+        except Exception as e:
+            # 💡: If refresh fails completely, keep the old cache to maintain service
+            logger.error(
+                f"Cache refresh failed completely, keeping old cache: {e}",
+                exc_info=True,
+            )
+            return
+
+        with self._cache_lock:
+            self._insights_cache = new_cache
+            self._insights_list = new_list
+            self._trigram_index = new_index
+            self._indexed_trigrams = new_indexed_trigrams
+            self._insights_dir_mtime_ns = dir_mtime_ns
+            # A write that landed during the scan may be missing from the snapshot;
+            # its file is on disk, so the next read rescans to pick it up
+            self._cache_loaded = self._cache_generation == generation
+
+    def _read_insights_from_disk(self) -> Dict[str, Insight]:
+        """Read and parse every insight file. Touches no cache state."""
+        insights: Dict[str, Insight] = {}
+
+        # Scan insights directory for JSON files
+        if not self.insights_dir.exists():
+            logger.debug("Insights directory does not exist, cache refresh complete")
+            return insights
+
+        loaded_count = 0
+        skipped_count = 0
+
+        # 💡: scandir yields names without building a Path per entry like glob()
+        insight_files = []
+        with os.scandir(self.insights_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                uuid_str = entry.name[:-len(".json")]
                 
-                loaded_count = 0
-                skipped_count = 0
+                # Validate UUID format
+                if not self._validate_uuid_filename(uuid_str):
+                    logger.debug(
+                        f"Skipping file with invalid UUID filename: {entry.name}"
+                    )
+                    skipped_count += 1
+                    continue
                 
-                for file_path in self.insights_dir.glob("*.json"):
-                    uuid_str = file_path.stem
+                insight_files.append((uuid_str, entry.path))
+
+        with ThreadPoolExecutor(max_workers=REFRESH_READ_WORKERS) as pool:
+            contents = pool.map(_read_bytes, [path for _, path in insight_files])
+
+            files_and_contents = zip(insight_files, contents, strict=True)
+            for (uuid_str, file_path), content in files_and_contents:
+                try:
+                    if isinstance(content, OSError):
+                        raise content
                     
-                    # Validate UUID format
-                    if not self._validate_uuid_filename(uuid_str):
-                        logger.debug(f"Skipping file with invalid UUID filename: {file_path.name}")
-                        skipped_count += 1
-                        continue
+                    # Load insight from file
+                    # 💡: orjson parses the raw bytes in C, which dominates
+                    # full-refresh time
+                    insight_data = orjson.loads(content)
                     
-                    try:
-                        # Load insight from file
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            insight_data = json.load(f)
-                        
-                        # Convert to Insight object
-                        insight = Insight.model_validate(insight_data)
-                        self._insights_cache[uuid_str] = insight
-                        loaded_count += 1
-                        
-                    except (json.JSONDecodeError, ValueError, OSError) as e:
-                        # 💡: Skip corrupted files rather than failing entirely
-                        logger.warning(f"Failed to load insight from {file_path}: {e}")
-                        skipped_count += 1
-                        continue
-                
-                self._cache_loaded = True
-                logger.debug(f"Cache refresh complete: loaded {loaded_count} insights, skipped {skipped_count} files")
-                
-            except Exception as e:
-                # 💡: If refresh fails completely, restore old cache to maintain service
-                logger.error(f"Cache refresh failed completely, keeping old cache: {e}", exc_info=True)
-                self._insights_cache = old_cache
+                    # Convert to Insight object
+                    insights[uuid_str] = Insight.model_validate(insight_data)
+                    loaded_count += 1
+
+                except (orjson.JSONDecodeError, ValueError, OSError) as e:
+                    # 💡: Skip corrupted files rather than failing entirely
+                    logger.warning(f"Failed to load insight from {file_path}: {e}")
+                    skipped_count += 1
+                    continue
+
+        logger.debug(
+            f"Cache refresh complete: loaded {loaded_count} insights, "
+            f"skipped {skipped_count} files"
+        )
+        return insights
     
     def _mark_uuid_as_written(self, uuid_str: str) -> None:
         """
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from pydantic import PrivateAttr
+
 from .models import Insight, HippoStorage
 
 
@@ -14,6 +16,10 @@ class InMemoryStorage(HippoStorage):
     Implements StorageProtocol for compatibility with HippoServer.
     """
     
+    # 💡: Creation day of each insight, recorded when it is added so temporal tests can
+    # look it up directly instead of probing daily_access_counts
+    _creation_days: Dict[UUID, int] = PrivateAttr(default_factory=dict)
+
     def __init__(self, initial_active_day: int = 1):
         """Initialize with empty insights and controllable active day."""
         # 💡: Start with day 1 rather than 0 to make test scenarios more intuitive
@@ -34,26 +40,62 @@ class InMemoryStorage(HippoStorage):
         pass
     
     # StorageProtocol implementation
+    async def connect(self) -> None:
+        """No-op for in-memory storage."""
+        pass
+
+    async def disconnect(self) -> None:
+        """No-op for in-memory storage."""
+        pass
+
     async def get_all_insights(self) -> List[Insight]:
         """Get all insights from storage."""
         return self.insights
     
-    # These methods are now async in the parent class, so we can call them directly
-    # No need to override since they already match the protocol
+    async def get_current_active_day(self) -> int:
+        """Get the current active day without consulting the calendar."""
+        # 💡: Tests move time with TimeController; a calendar-driven increment on first
+        # use would silently shift every expected day by one
+        return self.active_day_counter
+
+    def creation_day_of(self, uuid: UUID) -> Optional[int]:
+        """Get the active day on which an insight was added, or None if unknown."""
+        return self._creation_days.get(uuid)
+
+    async def add_insight(self, insight: Insight) -> None:
+        """Add a new insight and record its creation day."""
+        await super().add_insight(insight)
+        # The first recorded access is the creation day; fall back to today if none
+        if insight.daily_access_counts:
+            self._creation_days[insight.uuid] = insight.daily_access_counts[0][0]
+        else:
+            self._creation_days[insight.uuid] = self.active_day_counter
+
+    def remove_by_uuid(self, uuid: UUID) -> bool:
+        """Remove an insight by UUID and forget its creation day."""
+        self._creation_days.pop(uuid, None)
+        return super().remove_by_uuid(uuid)
+
+    async def get_insight(self, uuid: UUID) -> Optional[Insight]:
+        """Get a single insight by UUID."""
+        return self.find_by_uuid(uuid)
     
     async def store_insight(self, insight: Insight) -> str:
         """Store/update an insight in storage."""
         # For in-memory storage, storing is the same as adding if not exists
-        existing = self.find_by_uuid(insight.uuid)
-        if existing:
+        idx = self._positions.get(insight.uuid)
+        if idx is not None:
             # Update existing insight
-            idx = self.insights.index(existing)
             self.insights[idx] = insight
         else:
             # Add new insight
-            self.insights.append(insight)
+            await self.add_insight(insight)
         
-        return str(insight.uuid)
+        return insight.uuid_str
+
+    async def store_insights(self, insights: List[Insight]) -> List[str]:
+        """Store/update several insights in storage."""
+        return [await self.store_insight(insight) for insight in insights]
     
     async def record_insight_access(self, uuid: UUID) -> None:
         """Record that an insight was accessed."""
@@ -61,6 +103,17 @@ class InMemoryStorage(HippoStorage):
         if insight:
             insight.record_access(await self.get_current_active_day())
     
+    async def record_insight_accesses(
+        self, uuids: List[UUID], current_active_day: Optional[int] = None
+    ) -> None:
+        """Record that several insights were accessed on the given (or current) day."""
+        if current_active_day is None:
+            current_active_day = await self.get_current_active_day()
+        for uuid in uuids:
+            insight = self.find_by_uuid(uuid)
+            if insight:
+                insight.record_access(current_active_day)
+
     def __enter__(self) -> 'InMemoryStorage':
         """Context manager entry."""
         return self
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import math
+import sys
+from bisect import bisect_left
 from datetime import datetime, timezone, date
-from typing import List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from .constants import (
     FREQUENCY_WINDOW_DAYS,
@@ -18,6 +21,20 @@ from .constants import (
 )
 
 
+# 💡: Recency is exp(-rate * whole active days), so with the default rate there are only
+# a few thousand distinct values in practice; look them up instead of calling exp per
+# insight
+_RECENCY_TABLE_DAYS = 3650
+_RECENCY_TABLE = tuple(
+    math.exp(-RECENCY_DECAY_RATE * days) for days in range(_RECENCY_TABLE_DAYS)
+)
+
+
+def _intern_situation(situation: List[str]) -> List[str]:
+    """Intern situation elements so repeated phrases share one string object."""
+    return [sys.intern(elem) for elem in situation]
+
+
 class Insight(BaseModel):
     """An insight generated during AI-human collaboration."""
     
@@ -50,6 +67,13 @@ class Insight(BaseModel):
         description=f"List of (active_day, access_count) pairs, max {MAX_DAILY_ACCESS_ENTRIES} entries, oldest first. Active days are calendar days when the system was actually used (vacation-proof)."
     )
     
+    @field_validator("situation")
+    @classmethod
+    def _intern_situation_elements(cls, situation: List[str]) -> List[str]:
+        # 💡: The same situational phrases recur across many insights, so interning
+        # them on load collapses the duplicates across a large corpus
+        return _intern_situation(situation)
+
     @classmethod
     def create(
         cls,
@@ -73,38 +97,81 @@ class Insight(BaseModel):
         insight.daily_access_counts = [(current_active_day, 1)]
         return insight
     
-    def compute_current_importance(self) -> float:
+    @cached_property
+    def uuid_str(self) -> str:
+        """
+        String form of the UUID, cached since the UUID never changes.
+
+        💡: Storage keys and search output format the UUID on every call; formatting
+        it once per insight keeps that off the hot paths.
+        """
+        return str(self.uuid)
+
+    @cached_property
+    def situation_lower(self) -> Tuple[str, ...]:
+        """
+        Lowercased situation elements, cached for case-insensitive filter matching.
+
+        💡: Situation filtering lowercases every element for every filter term on every
+        search; computing it once per insight keeps that out of the search loop.
+        Invalidated by update_content when the situation changes.
+        """
+        return tuple(elem.lower() for elem in self.situation)
+
+    def compute_current_importance(self, now: Optional[datetime] = None) -> float:
         """
         Compute the current importance based on temporal decay.
         
         Formula: current_importance = base_importance * recency_factor
         where recency_factor = 0.9 ^ days_since_importance_last_modified
+
+        Args:
+            now: Reference time; pass one in to share one clock read across insights
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         days_elapsed = (now - self.importance_last_modified_at).total_seconds() / 86400
         recency_factor = math.pow(0.9, days_elapsed)
         return self.importance * recency_factor
     
-    def days_since_created(self) -> float:
-        """Calculate days since creation."""
-        now = datetime.now(timezone.utc)
+    def days_since_created(self, now: Optional[datetime] = None) -> float:
+        """
+        Calculate days since creation.
+
+        Args:
+            now: Reference time; pass one in to share one clock read across insights
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         return (now - self.created_at).total_seconds() / 86400
     
-    def days_since_importance_modified(self) -> float:
-        """Calculate days since importance was last modified."""
-        now = datetime.now(timezone.utc)
+    def days_since_importance_modified(self, now: Optional[datetime] = None) -> float:
+        """
+        Calculate days since importance was last modified.
+
+        Args:
+            now: Reference time; pass one in to share one clock read across insights
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         return (now - self.importance_last_modified_at).total_seconds() / 86400
     
-    def apply_reinforcement(self, multiplier: float) -> None:
+    def apply_reinforcement(
+        self, multiplier: float, now: Optional[datetime] = None
+    ) -> None:
         """
         Apply reinforcement (upvote/downvote) to the insight.
         
         Args:
-            multiplier: Importance multiplier (UPVOTE_MULTIPLIER for upvote, DOWNVOTE_MULTIPLIER for downvote)
+            multiplier: Importance multiplier (UPVOTE_MULTIPLIER for upvote,
+                DOWNVOTE_MULTIPLIER for downvote)
+            now: Reference time; pass one in to share one clock read across insights
         """
-        current_importance = self.compute_current_importance()
+        if now is None:
+            now = datetime.now(timezone.utc)
+        current_importance = self.compute_current_importance(now)
         self.importance = min(1.0, current_importance * multiplier)  # Cap at 1.0
-        self.importance_last_modified_at = datetime.now(timezone.utc)
+        self.importance_last_modified_at = now
     
     def record_access(self, current_active_day: int) -> None:
         """
@@ -116,8 +183,19 @@ class Insight(BaseModel):
         # 💡: Using active day counter instead of calendar time to handle vacation periods
         # where the system isn't used - insights don't decay during inactive periods
         
+        # 💡: Accesses are persisted in deferred batches, so one can arrive after a
+        # later day's entry; keep the list ordered by day
+        last_day = self.daily_access_counts[-1][0] if self.daily_access_counts else None
+        if last_day is not None and current_active_day < last_day:
+            days = [day for day, _ in self.daily_access_counts]
+            idx = bisect_left(days, current_active_day)
+            if days[idx] == current_active_day:
+                count = self.daily_access_counts[idx][1]
+                self.daily_access_counts[idx] = (current_active_day, count + 1)
+            else:
+                self.daily_access_counts.insert(idx, (current_active_day, 1))
         # Find today's entry in the access counts list
-        if self.daily_access_counts and self.daily_access_counts[-1][0] == current_active_day:
+        elif last_day == current_active_day:
             # Increment existing entry for today
             day, count = self.daily_access_counts[-1]
             self.daily_access_counts[-1] = (day, count + 1)
@@ -147,23 +225,28 @@ class Insight(BaseModel):
         # from long gaps. An insight accessed twice in 30 days should have higher
         # frequency than one accessed once in 1 day.
         window_start = current_active_day - window_days + 1
-        recent_entries = [
-            (day, count) for day, count in self.daily_access_counts 
-            if day >= window_start
-        ]
         
-        if not recent_entries:
-            return 0.0
+        # 💡: Track the oldest/newest recent day with min/max rather than sorting, which
+        # also copes with daily_access_counts becoming unsorted due to time manipulation
+        # in tests - one pass, no intermediate list
+        oldest_recent_day: Optional[int] = None
+        newest_recent_day = 0
+        total_recent_accesses = 0
+        for day, count in self.daily_access_counts:
+            if day < window_start:
+                continue
+            if oldest_recent_day is None:
+                oldest_recent_day = newest_recent_day = day
+            elif day < oldest_recent_day:
+                oldest_recent_day = day
+            elif day > newest_recent_day:
+                newest_recent_day = day
+            total_recent_accesses += count
         
-        # 💡: Sort recent_entries by day to handle cases where daily_access_counts
-        # becomes unsorted due to time manipulation in tests
-        recent_entries.sort(key=lambda x: x[0])
+        if oldest_recent_day is None:
+            return 0.0
         
-        oldest_recent_day = recent_entries[0][0]
-        newest_recent_day = recent_entries[-1][0]
         recent_days_spanned = newest_recent_day - oldest_recent_day + 1
-        total_recent_accesses = sum(count for _, count in recent_entries)
-        
         return total_recent_accesses / recent_days_spanned
     
     def calculate_recency_score(self, current_active_day: int, decay_rate: float = RECENCY_DECAY_RATE) -> float:
@@ -184,6 +267,9 @@ class Insight(BaseModel):
         
         last_access_day = self.daily_access_counts[-1][0]
         active_days_since_access = current_active_day - last_access_day
+        in_table = 0 <= active_days_since_access < _RECENCY_TABLE_DAYS
+        if decay_rate == RECENCY_DECAY_RATE and in_table:
+            return _RECENCY_TABLE[active_days_since_access]
         return math.exp(-decay_rate * active_days_since_access)
     
     def update_content(
@@ -197,7 +283,8 @@ class Insight(BaseModel):
             self.content = content
             self.content_last_modified_at = datetime.now(timezone.utc)
         if situation is not None:
-            self.situation = situation
+            self.situation = _intern_situation(situation)
+            self.__dict__.pop('situation_lower', None)
             self.content_last_modified_at = datetime.now(timezone.utc)
         if importance is not None:
             self.importance = importance
@@ -219,6 +306,16 @@ class HippoStorage(BaseModel):
         description="Last calendar date the system was used (to detect new active days)"
     )
     
+    # 💡: Position of each insight in self.insights, so lookups and updates by UUID
+    # are dict hits instead of linear scans over the whole list
+    _positions: Dict[UUID, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index the loaded insights by UUID."""
+        self._positions = {
+            insight.uuid: idx for idx, insight in enumerate(self.insights)
+        }
+
     async def get_current_active_day(self) -> int:
         """
         Get the current active day, incrementing the counter if this is a new calendar day.
@@ -237,19 +334,23 @@ class HippoStorage(BaseModel):
     
     async def add_insight(self, insight: Insight) -> None:
         """Add a new insight to storage."""
+        self._positions[insight.uuid] = len(self.insights)
         self.insights.append(insight)
     
     def find_by_uuid(self, uuid: UUID) -> Optional[Insight]:
         """Find an insight by UUID."""
-        for insight in self.insights:
-            if insight.uuid == uuid:
-                return insight
-        return None
+        idx = self._positions.get(uuid)
+        return None if idx is None else self.insights[idx]
     
     def remove_by_uuid(self, uuid: UUID) -> bool:
         """Remove an insight by UUID. Returns True if found and removed."""
-        for i, insight in enumerate(self.insights):
-            if insight.uuid == uuid:
-                del self.insights[i]
-                return True
-        return False
\ No newline at end of file
+        idx = self._positions.pop(uuid, None)
+        if idx is None:
+            return False
+
+        # 💡: Keep the remaining insights in order - it is saved to disk and breaks
+        # score ties in search - so only the insights after the gap need reindexing
+        del self.insights[idx]
+        for pos in range(idx, len(self.insights)):
+            self._positions[self.insights[pos].uuid] = pos
+        return True
\ No newline at end of file
@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
 
-from .models import Insight
 from .constants import (
-    RELEVANCE_WEIGHT_RECENCY,
+    CONTENT_MATCH_THRESHOLD,
+    EMBEDDING_CACHE_SIZE,
+    MAX_REASONABLE_FREQUENCY,
+    RELEVANCE_WEIGHT_CONTEXT,
     RELEVANCE_WEIGHT_FREQUENCY,
     RELEVANCE_WEIGHT_IMPORTANCE,
-    RELEVANCE_WEIGHT_CONTEXT,
-    MAX_REASONABLE_FREQUENCY,
-    CONTENT_MATCH_THRESHOLD,
+    RELEVANCE_WEIGHT_RECENCY,
+    SIMILARITY_CACHE_SIZE,
     SITUATION_MATCH_THRESHOLD,
 )
+from .models import Insight
 
 # Configure logging for sentence transformers (can be noisy)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
+logger = logging.getLogger(__name__)
+
+# Relevance distribution buckets: each lower edge starts a bucket ([0.2, 0.4) is
+# "0.2_to_0.4"), except that 1.0 itself still counts as "0.8_to_1.0"
+_DISTRIBUTION_BUCKETS = (
+    "below_0.2", "0.2_to_0.4", "0.4_to_0.6", "0.6_to_0.8", "0.8_to_1.0", "above_1.0"
+)
+_DISTRIBUTION_EDGES = (0.2, 0.4, 0.6, 0.8)
+
 
 class SearchResult(BaseModel):
     """A single search result with computed relevance."""
@@ -66,6 +81,21 @@ class InsightSearcher:
         """Initialize with sentence transformer model."""
         # Use a fast, lightweight model for local inference
         self._model: Optional[SentenceTransformer] = None
+
+        # 💡: Embeddings depend only on the text, so cache them across searches.
+        # Insight contents and situations rarely change and users often repeat
+        # queries, so most searches only need to encode the new query text.
+        self._embedding_cache: OrderedDict[str, Any] = OrderedDict()
+
+        # 💡: Search results themselves can't be cached - every search records accesses
+        # and importance decays with time - but the similarity of two texts never
+        # changes. Caching it skips cosine_similarity's per-call validation for repeated
+        # pairs.
+        self._similarity_cache: OrderedDict[Tuple[str, str], float] = OrderedDict()
+
+        # 💡: Embeddings prefetched for the search in progress. Scoring reads them from
+        # here first, since a corpus larger than the LRU would evict them before use.
+        self._search_embeddings: Dict[str, Any] = {}
     
     @property
     def model(self) -> SentenceTransformer:
@@ -75,6 +105,67 @@ class InsightSearcher:
             self._model = SentenceTransformer('all-MiniLM-L6-v2')
         return self._model
     
+    def _embed(self, text: str) -> Any:
+        """Get a text's embedding from the prefetched batch, LRU cache, or model."""
+        embedding = self._search_embeddings.get(text)
+        if embedding is not None:
+            return embedding
+
+        embedding = self._embedding_cache.get(text)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(text)
+            return embedding
+
+        embedding = self.model.encode([text])[0]
+        self._cache_embedding(text, embedding)
+        return embedding
+
+    def _cache_embedding(self, text: str, embedding: Any) -> None:
+        """Add an embedding to the LRU cache, evicting the oldest entry when full."""
+        self._embedding_cache[text] = embedding
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
+    def _prefetch_embeddings(self, texts: Sequence[str]) -> None:
+        """
+        Collect embeddings for the current search, encoding uncached texts in one batch.
+
+        💡: The model encodes a batch far faster than the same texts one at a time,
+        so a search gathers every embedding up front and per-pair scoring then only
+        looks them up. Callers clear _search_embeddings once scoring is done.
+        """
+        missing = []
+        for text in dict.fromkeys(texts):
+            if text in self._search_embeddings:
+                continue
+            cached = self._embedding_cache.get(text)
+            if cached is not None:
+                self._search_embeddings[text] = cached
+            else:
+                missing.append(text)
+        if not missing:
+            return
+
+        for text, embedding in zip(missing, self.model.encode(missing), strict=True):
+            self._search_embeddings[text] = embedding
+            self._cache_embedding(text, embedding)
+
+    def _similarity(self, text1: str, text2: str) -> float:
+        """Get the raw cosine similarity of two texts, via the LRU cache if possible."""
+        key = (text1, text2)
+        similarity = self._similarity_cache.get(key)
+        if similarity is not None:
+            self._similarity_cache.move_to_end(key)
+            return similarity
+
+        similarity = float(
+            cosine_similarity([self._embed(text1)], [self._embed(text2)])[0][0]
+        )
+        self._similarity_cache[key] = similarity
+        if len(self._similarity_cache) > SIMILARITY_CACHE_SIZE:
+            self._similarity_cache.popitem(last=False)
+        return similarity
+
     def search(
         self,
         insights: List[Insight],
@@ -116,8 +207,14 @@ class InsightSearcher:
             ]
         
         # Apply pagination
+        # 💡: Only the top offset+count results are ever returned, so select them with a
+        # heap (O(N log K)) instead of sorting every match. nlargest breaks ties in
+        # input order, exactly like a stable descending sort.
         offset, count = limit or (0, 10)
-        paginated = filtered[offset:offset + count]
+        top = heapq.nlargest(
+            max(0, offset + count), filtered, key=lambda r: r.relevance
+        )
+        paginated = top[offset:]
         
         # Record access for returned insights if requested
         if record_access:
@@ -137,56 +234,120 @@ class InsightSearcher:
         situation_filter: Optional[List[str]],
         current_active_day: int,
     ) -> List[SearchResult]:
-        """Compute relevance scores for all insights without applying filters."""
+        """
+        Compute relevance scores for all insights without applying filters.
+
+        Results are returned in input order; search() ranks only the page it returns.
+        """
         results = []
         
-        for insight in insights:
-            # Step 1: Compute current importance (reinforcement with decay)
-            current_importance = insight.compute_current_importance()
-            
-            # Step 2: Compute semantic relevance scores
-            content_relevance = self._compute_content_relevance(insight.content, query) if query else 1.0
-            situation_relevance, situation_matches = (
-                self._compute_situation_relevance(insight.situation, situation_filter) 
-                if situation_filter 
-                else (1.0, [])
-            )
+        # Lowercase filter terms once per search rather than once per situation element
+        filter_lower = (
+            [term.lower() for term in situation_filter] if situation_filter else None
+        )
+
+        try:
+            # 💡: Gather query, content and situation texts into one prefetch so they
+            # are encoded in a single model call and none displaces another before
+            # scoring
+            texts: List[str] = []
+            if query:
+                # Very short contents are matched by substring, so they don't need
+                # embeddings
+                texts.append(query)
+                texts.extend(
+                    insight.content
+                    for insight in insights
+                    if len(insight.content.strip()) >= 10
+                )
+            if situation_filter:
+                # Non-substring filter/element pairs are scored semantically, so warm
+                # those too
+                texts.extend(situation_filter)
+                texts.extend(elem for insight in insights for elem in insight.situation)
             
-            # Step 3: Compute temporal factors
-            # 💡: Using research-based formula: 30% recency + 20% frequency + 35% importance + 15% context
-            recency_score = insight.calculate_recency_score(current_active_day)
-            frequency_score = insight.calculate_frequency(current_active_day)
+            if texts:
+                try:
+                    self._prefetch_embeddings(texts)
+                except Exception as e:
+                    # Scoring falls back per pair (e.g. to substring matching) if the
+                    # model is unavailable
+                    logger.warning("Batch embedding for search failed: %s", e)
             
-            # Normalize frequency score to 0-1 range
-            normalized_frequency = min(1.0, frequency_score / MAX_REASONABLE_FREQUENCY)
+            # Read the clock once so every insight decays relative to the same instant
+            now = datetime.now(timezone.utc)
             
-            # Step 4: Calculate final composite relevance using research formula
-            final_relevance = (
-                RELEVANCE_WEIGHT_RECENCY * recency_score +
-                RELEVANCE_WEIGHT_FREQUENCY * normalized_frequency +
-                RELEVANCE_WEIGHT_IMPORTANCE * current_importance +
-                RELEVANCE_WEIGHT_CONTEXT * situation_relevance
-            )
+            # 💡: Bind the module-level weights and thresholds to locals so the
+            # per-insight loop does fast local loads instead of global dict lookups
+            weight_recency = RELEVANCE_WEIGHT_RECENCY
+            weight_frequency = RELEVANCE_WEIGHT_FREQUENCY
+            weight_importance = RELEVANCE_WEIGHT_IMPORTANCE
+            weight_context = RELEVANCE_WEIGHT_CONTEXT
+            max_frequency = MAX_REASONABLE_FREQUENCY
+            content_threshold = CONTENT_MATCH_THRESHOLD
+            situation_threshold = SITUATION_MATCH_THRESHOLD
             
-            # Step 5: Apply minimal filtering - either content or situation must have some relevance
-            # 💡: Only exclude insights that are completely irrelevant to the query/situation
-            content_match = content_relevance > CONTENT_MATCH_THRESHOLD
-            query_passes = not query or content_match
-            situation_passes = not situation_filter or situation_relevance > SITUATION_MATCH_THRESHOLD
+            for insight in insights:
+                # Step 1: Compute current importance (reinforcement with decay)
+                current_importance = insight.compute_current_importance(now)
+
+                # Step 2: Compute semantic relevance scores
+                content_relevance = (
+                    self._compute_content_relevance(insight.content, query)
+                    if query
+                    else 1.0
+                )
+                situation_relevance, situation_matches = (
+                    self._compute_situation_relevance(
+                        insight.situation,
+                        situation_filter,
+                        situation_lower=insight.situation_lower,
+                        filter_lower=filter_lower,
+                    )
+                    if situation_filter
+                    else (1.0, [])
+                )
+
+                # Step 3: Compute temporal factors
+                # 💡: Using research-based formula: 30% recency + 20% frequency + 35%
+                # importance + 15% context
+                recency_score = insight.calculate_recency_score(current_active_day)
+                frequency_score = insight.calculate_frequency(current_active_day)
+
+                # Normalize frequency score to 0-1 range
+                normalized_frequency = min(1.0, frequency_score / max_frequency)
+
+                # Step 4: Calculate final composite relevance using research formula
+                final_relevance = (
+                    weight_recency * recency_score +
+                    weight_frequency * normalized_frequency +
+                    weight_importance * current_importance +
+                    weight_context * situation_relevance
+                )
+
+                # Step 5: Apply minimal filtering - either content or situation must
+                # have some relevance
+                # 💡: Only exclude insights that are completely irrelevant to the
+                # query/situation
+                content_match = content_relevance > content_threshold
+                query_passes = not query or content_match
+                situation_passes = (
+                    not situation_filter or situation_relevance > situation_threshold
+                )
+
+                # Only include if there's some relevance to the query
+                if query_passes and situation_passes:
+                    results.append(SearchResult(
+                        insight=insight,
+                        importance=current_importance,
+                        relevance=final_relevance,
+                        content_match=content_match,
+                        situation_matches=situation_matches,
+                    ))
             
-            # Only include if there's some relevance to the query
-            if query_passes and situation_passes:
-                results.append(SearchResult(
-                    insight=insight,
-                    importance=current_importance,
-                    relevance=final_relevance,
-                    content_match=content_match,
-                    situation_matches=situation_matches,
-                ))
-        
-        # Sort by relevance (highest first)
-        results.sort(key=lambda r: r.relevance, reverse=True)
-        return results
+            return results
+        finally:
+            self._search_embeddings = {}
     
     def _compute_content_relevance(self, content: str, query: str) -> float:
         """Compute semantic relevance between content and query."""
@@ -199,8 +360,7 @@ class InsightSearcher:
         
         try:
             # Compute semantic similarity using sentence transformers
-            embeddings = self.model.encode([content, query])
-            similarity = float(cosine_similarity([embeddings[0]], [embeddings[1]])[0][0])
+            similarity = self._similarity(content, query)
             
             # Cosine similarity ranges from -1 to 1:
             # 1 = identical meaning, 0 = unrelated, -1 = opposite meaning
@@ -225,25 +385,38 @@ class InsightSearcher:
     def _compute_situation_relevance(
         self,
         situation: List[str],
-        filter_terms: Optional[List[str]]
+        filter_terms: Optional[List[str]],
+        *,
+        situation_lower: Optional[Sequence[str]] = None,
+        filter_lower: Optional[Sequence[str]] = None,
     ) -> Tuple[float, List[str]]:
         """
         Compute situation relevance and find matching elements.
         
+        Callers scoring many insights can pass precomputed lowercased
+        situation elements and filter terms to avoid re-lowercasing per pair.
+
         Returns (relevance_score, matching_elements).
         """
         if not filter_terms:
             return 1.0, []
         
+        if situation_lower is None:
+            situation_lower = [elem.lower() for elem in situation]
+        if filter_lower is None:
+            filter_lower = [term.lower() for term in filter_terms]
+
         matches = []
         relevance_scores = []
         
-        for situation_elem in situation:
+        situation_pairs = zip(situation, situation_lower, strict=True)
+        for situation_elem, situation_elem_lower in situation_pairs:
             best_match_score = 0.0
             
-            for filter_term in filter_terms:
+            filter_pairs = zip(filter_terms, filter_lower, strict=True)
+            for filter_term, filter_term_lower in filter_pairs:
                 # Exact substring match gets high score
-                if filter_term.lower() in situation_elem.lower():
+                if filter_term_lower in situation_elem_lower:
                     score = 0.9
                     if best_match_score < score:
                         best_match_score = score
@@ -270,8 +443,7 @@ class InsightSearcher:
     def _compute_semantic_similarity(self, text1: str, text2: str) -> float:
         """Compute semantic similarity between two texts."""
         try:
-            embeddings = self.model.encode([text1, text2])
-            similarity = float(cosine_similarity([embeddings[0]], [embeddings[1]])[0][0])
+            similarity = self._similarity(text1, text2)
             # Cosine similarity ranges from -1 to 1, but for search relevance
             # we only want positive similarities (negative = irrelevant, not anti-relevant)
             return max(0.0, similarity)
@@ -294,28 +466,17 @@ class InsightSearcher:
         """Calculate distribution of relevance scores from SearchResult objects."""
         # 💡: Calculate distribution from already-computed SearchResults to avoid
         # duplicating the relevance calculation logic
-        distribution = {
-            "below_0.2": 0,
-            "0.2_to_0.4": 0,
-            "0.4_to_0.6": 0,
-            "0.6_to_0.8": 0,
-            "0.8_to_1.0": 0,
-            "above_1.0": 0,
-        }
+        counts = [0] * len(_DISTRIBUTION_BUCKETS)
+        above_index = len(_DISTRIBUTION_BUCKETS) - 1
         
+        # 💡: Find each bucket with a C-level bisect over the edges instead of walking
+        # an if/elif ladder; exact at the edges, unlike scaling and truncating the
+        # relevance
         for result in results:
             relevance = result.relevance
-            if relevance < 0.2:
-                distribution["below_0.2"] += 1
-            elif relevance < 0.4:
-                distribution["0.2_to_0.4"] += 1
-            elif relevance < 0.6:
-                distribution["0.4_to_0.6"] += 1
-            elif relevance < 0.8:
-                distribution["0.6_to_0.8"] += 1
-            elif relevance <= 1.0:
-                distribution["0.8_to_1.0"] += 1
+            if relevance <= 1.0:
+                counts[bisect_right(_DISTRIBUTION_EDGES, relevance)] += 1
             else:
-                distribution["above_1.0"] += 1
+                counts[above_index] += 1
         
-        return distribution
\ No newline at end of file
+        return dict(zip(_DISTRIBUTION_BUCKETS, counts, strict=True))
\ No newline at end of file
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import signal
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 from uuid import UUID
 
 import click
+import orjson
 import structlog
 from mcp.server import Server
+from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
@@ -26,6 +46,67 @@ from .storage_protocol import StorageProtocol
 # to log to stderr to avoid interfering with the MCP protocol on stdout
 import os
 
+# 💡: Log records are buffered and written to hippo.log in batches of this many;
+# anything at ERROR or above flushes the buffer immediately so failures are never held
+# back
+LOG_BUFFER_CAPACITY = 256
+
+# 💡: File logging runs through one process-wide listener thread and buffer; they live
+# at module level so repeated setup_logging() calls replace them instead of stacking
+# more
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_buffer: Optional[logging.handlers.MemoryHandler] = None
+
+def shutdown_logging() -> None:
+    """
+    Stop the background log writer, writing out everything queued and buffered so far.
+
+    Records logged afterwards are written synchronously, so errors raised while the
+    process exits still reach hippo.log.
+    """
+    global _log_listener
+    if _log_listener is None or _log_buffer is None:
+        return
+
+    # Stopping the listener drains the queue into the buffer
+    _log_listener.stop()
+    _log_listener = None
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(_log_buffer)
+    _log_buffer.flush()
+
+def _close_file_logging() -> None:
+    """Shut down file logging from a previous setup_logging() call, if any."""
+    global _log_buffer
+    shutdown_logging()
+    if _log_buffer is None:
+        return
+
+    target = _log_buffer.target
+    logging.getLogger().removeHandler(_log_buffer)
+    _log_buffer.close()  # Flushes into the file handler first
+    if target is not None:
+        target.close()
+    _log_buffer = None
+
+def _flush_logs_and_terminate() -> None:
+    """Write out buffered logs, then let SIGTERM terminate the process as usual."""
+    shutdown_logging()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+# Runs before logging's own atexit hook (registered when logging was imported), so the
+# queue is drained before logging flushes and closes the handlers
+atexit.register(shutdown_logging)
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer (logging wants str)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
 def setup_logging(memory_dir: Path) -> structlog.BoundLogger:
     """
     Set up structured logging configuration based on HIPPO_LOG environment variable.
@@ -36,11 +117,19 @@ def setup_logging(memory_dir: Path) -> structlog.BoundLogger:
     Returns:
         Configured structlog logger
     """
+    global _log_listener, _log_buffer
+
     hippo_log = os.environ.get('HIPPO_LOG')
     
+    # Replace, rather than add to, any file logging set up by an earlier call
+    _close_file_logging()
+
     # 💡: Configure structlog processors for consistent structured output
-    # Add timestamp, log level, and logger name to all log entries
+    # Add timestamp, log level, and logger name to all log entries.
+    # filter_by_level goes first so calls below the configured level are dropped before
+    # any timestamping or rendering happens - by default everything below ERROR is.
     processors: List[Any] = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -64,14 +153,34 @@ def setup_logging(memory_dir: Path) -> structlog.BoundLogger:
         memory_dir.mkdir(parents=True, exist_ok=True)
         
         # Configure JSON output for file logging
-        processors.append(structlog.processors.JSONRenderer())
+        # 💡: orjson renders each event several times faster than stdlib json
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
         
-        # Set up stdlib logging to write to file
+        # Set up stdlib logging to write to file, buffering records so a chatty
+        # tool-call path doesn't turn every log line into its own write() syscall.
+        # shutdown_logging() writes out what's left.
+        file_handler = logging.FileHandler(str(log_file), mode='a', encoding='utf-8')
+        # Let structlog handle formatting
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        _log_buffer = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+
+        # 💡: The event loop only enqueues records; a listener thread does the file I/O
+        # so logging never blocks concurrent tool calls
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, _log_buffer)
+        _log_listener.start()
+
+        # The queue handler formats records before enqueueing them, so give it the bare
+        # format too; basicConfig would otherwise prefix every line with level and name
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
         logging.basicConfig(
             level=log_level,
-            format='%(message)s',  # Let structlog handle formatting
-            filename=str(log_file),  # Ensure it's a string path
-            filemode='a',  # Append mode
+            handlers=[queue_handler],
             force=True  # Force reconfiguration of logging
         )
     else:
@@ -95,10 +204,325 @@ def setup_logging(memory_dir: Path) -> structlog.BoundLogger:
     
     return cast(structlog.BoundLogger, structlog.get_logger())
 
+# Limits for argument values logged with tool.request
+_LOG_MAX_STR_LEN = 100
+_LOG_MAX_LIST_ITEMS = 5
+
+def _sanitize_value(val: Any) -> Any:
+    """
+    Truncate a tool argument for logging.
+
+    💡: Log tool requests at INFO level with sanitized arguments for better metrics
+    tracking. Truncate large arguments to keep logs readable while preserving key
+    information.
+    """
+    if isinstance(val, str) and len(val) > _LOG_MAX_STR_LEN:
+        return f"{val[:_LOG_MAX_STR_LEN]}..."
+    elif isinstance(val, list):
+        if len(val) <= _LOG_MAX_LIST_ITEMS:
+            # Small lists: sanitize each item individually
+            return [_sanitize_value(item) for item in val]
+        else:
+            # Large lists: show the first items with individual sanitization, then count
+            sanitized_items = [
+                _sanitize_value(item) for item in val[:_LOG_MAX_LIST_ITEMS]
+            ]
+            return sanitized_items + [f"... +{len(val) - _LOG_MAX_LIST_ITEMS} more"]
+    else:
+        return val
+
+# Summary tag logged with each successful tool.response, so call_tool doesn't have to
+# sniff the response text (which for searches can be a large JSON document)
+_SUMMARY_BY_TOOL: Dict[str, str] = {
+    "hippo_record_insight": "created_insight",
+    "hippo_search_insights": "search_results",
+    "hippo_modify_insight": "modified_insight",
+    "hippo_reinforce_insight": "applied_reinforcement",
+}
+
+# 💡: Below this many search results, handing serialization to a thread costs more
+# than it saves
+SERIALIZE_IN_THREAD_MIN_RESULTS = 50
+
+# 💡: Access counts are non-critical metadata, so searches queue them and a background
+# task persists them in one batch after this delay instead of blocking the response
+ACCESS_FLUSH_DELAY_SECONDS = 0.2
+
 # Global logger instance - initialized in main()
 _logger: Optional[structlog.BoundLogger] = None
 
 
+def _text(text: str) -> List[TextContent]:
+    """
+    Build a single-item text response for a tool call.
+
+    💡: Uses model_construct to skip Pydantic validation - every response is a
+    plain string we generated ourselves, so validating it on each call is wasted work.
+    """
+    return [TextContent.model_construct(type="text", text=text)]
+
+
+def _validate_record_args(args: Dict[str, Any]) -> Tuple[str, List[str], float]:
+    """
+    Validate hippo_record_insight arguments.
+
+    Args:
+        args: Raw tool call arguments
+
+    Returns:
+        (content, situation, importance) tuple
+
+    Raises:
+        ValueError: If an argument is missing or malformed
+    """
+    content = args.get("content")
+    if not isinstance(content, str):
+        raise ValueError("'content' must be a string")
+
+    situation = args.get("situation")
+    if not isinstance(situation, list) or not all(
+        isinstance(s, str) for s in situation
+    ):
+        raise ValueError("'situation' must be an array of strings")
+
+    importance = args.get("importance")
+    if isinstance(importance, bool) or not isinstance(importance, (int, float)):
+        raise ValueError("'importance' must be a number")
+    if not 0.0 <= importance <= 1.0:
+        raise ValueError("'importance' must be between 0 and 1")
+
+    return content, situation, float(importance)
+
+def _validate_search_args(
+    args: Dict[str, Any],
+) -> Tuple[
+    str, Optional[List[str]], Tuple[int, int], Optional[Tuple[float, Optional[float]]]
+]:
+    """
+    Validate hippo_search_insights arguments, applying the schema defaults.
+
+    Args:
+        args: Raw tool call arguments
+
+    Returns:
+        (query, situation_filter, (offset, count), relevance_range) tuple
+
+    Raises:
+        ValueError: If an argument is malformed
+    """
+    query = args.get("query", "")
+    if not isinstance(query, str):
+        raise ValueError("'query' must be a string")
+
+    situation_filter = args.get("situation_filter")
+    if situation_filter is not None and (
+        not isinstance(situation_filter, list)
+        or not all(isinstance(s, str) for s in situation_filter)
+    ):
+        raise ValueError("'situation_filter' must be an array of strings")
+
+    limit_dict = args.get("limit") or {}
+    if not isinstance(limit_dict, dict):
+        raise ValueError("'limit' must be an object")
+    offset = limit_dict.get("offset", 0)
+    count = limit_dict.get("count", 10)
+    if (
+        isinstance(offset, bool)
+        or isinstance(count, bool)
+        or not isinstance(offset, int)
+        or not isinstance(count, int)
+    ):
+        raise ValueError("'limit.offset' and 'limit.count' must be integers")
+
+    relevance_range = None
+    rr = args.get("relevance_range")
+    if rr is not None:
+        if not isinstance(rr, dict):
+            raise ValueError("'relevance_range' must be an object")
+        rr_min = rr.get("min", 0.1)
+        rr_max = rr.get("max")
+        if isinstance(rr_min, bool) or not isinstance(rr_min, (int, float)):
+            raise ValueError("'relevance_range.min' must be a number")
+        if rr_max is not None and (
+            isinstance(rr_max, bool) or not isinstance(rr_max, (int, float))
+        ):
+            raise ValueError("'relevance_range.max' must be a number")
+        relevance_range = (float(rr_min), None if rr_max is None else float(rr_max))
+
+    return query, situation_filter, (offset, count), relevance_range
+
+def _parse_uuid_set(values: Iterable[str]) -> Set[UUID]:
+    """Parse a list of UUID strings, parsing each distinct string only once.
+
+    UUID() validates in pure Python, so dedupe the raw strings first - clients
+    often repeat the same UUID when voting on search results.
+    """
+    return {UUID(value) for value in set(values)}
+
+# Tool input schemas, kept as module constants so the tool list below stays readable.
+_RECORD_INSIGHT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "content": {
+            "type": "string",
+            "description": "The insight content - should be atomic and actionable"
+        },
+        "situation": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "Array of independent situational aspects describing when/where "
+                "this insight occurred. Include: 1) General activity (e.g. "
+                "'debugging authentication flow', 'design discussion about hippo'), "
+                "2) Specific problem/goal (e.g. 'users getting logged out randomly', "
+                "'defining MCP tool interface'), 3) Additional relevant details "
+                "(e.g. 'race condition suspected', 'comparing dialogue vs instruction "
+                "formats'). Each element should be independently meaningful for "
+                "search matching."
+            )
+        },
+        "importance": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": 1,
+            "description": (
+                "AI-assessed importance rating: 0.8+ breakthrough insights, "
+                "0.6-0.7 useful decisions, 0.4-0.5 incremental observations, "
+                "0.1-0.3 routine details"
+            )
+        }
+    },
+    "required": ["content", "situation", "importance"]
+}
+
+_SEARCH_INSIGHTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query for insight content"
+        },
+        "situation_filter": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "Filter results by matching any situation elements using partial "
+                "matching. Examples: ['debugging authentication'] matches insights "
+                "with 'debugging authentication flow', ['users getting logged out'] "
+                "matches specific problem contexts. Can provide multiple filters - "
+                "results match if ANY situation element partially matches ANY filter."
+            )
+        },
+        "limit": {
+            "type": "object",
+            "properties": {
+                "offset": {"type": "integer", "default": 0},
+                "count": {"type": "integer", "default": 10}
+            },
+            "description": (
+                "Result pagination. Default: {offset: 0, count: 10} returns "
+                "first 10 results. Examples: {offset: 10, count: 5} for next 5 results"
+            ),
+            "default": {"offset": 0, "count": 10}
+        },
+        "relevance_range": {
+            "type": "object",
+            "properties": {
+                "min": {"type": "number", "default": 0.1},
+                "max": {"type": "number"}
+            },
+            "description": (
+                "Relevance range filter. Examples: {min: 0.6, max: 1.0} for highly "
+                "relevant insights, {min: 1.0} for top-tier results, {max: 0.4} "
+                "for lower relevance insights"
+            )
+        }
+    },
+    "required": ["query"]
+}
+
+_MODIFY_INSIGHT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "uuid": {
+            "type": "string",
+            "description": "UUID of the insight to modify"
+        },
+        "content": {
+            "type": "string",
+            "description": "New insight content (optional - only provide if changing)"
+        },
+        "situation": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "New situational aspects array (optional - only provide if changing)"
+            )
+        },
+        "importance": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": 1,
+            "description": "New importance rating (optional - only provide if changing)"
+        },
+        "reinforce": {
+            "type": "string",
+            "enum": ["upvote", "downvote", "none"],
+            "description": (
+                "Reinforcement to apply with modification. Default: 'upvote' "
+                "(since modification usually signals value)"
+            ),
+            "default": "upvote"
+        }
+    },
+    "required": ["uuid"]
+}
+
+_REINFORCE_INSIGHT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "upvotes": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Array of UUIDs to upvote (1.5x importance multiplier)",
+            "default": []
+        },
+        "downvotes": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Array of UUIDs to downvote (0.5x importance multiplier)",
+            "default": []
+        }
+    }
+}
+
+# 💡: Tool definitions are static, so build them once at import time rather than
+# re-allocating the nested inputSchema dicts and Tool models on every list_tools call.
+# Treat this list as read-only - it is shared by every HippoServer instance.
+_TOOLS: List[Tool] = [
+    Tool(
+        name="hippo_record_insight",
+        description="Record a new insight during consolidation moments",
+        inputSchema=_RECORD_INSIGHT_SCHEMA,
+    ),
+    Tool(
+        name="hippo_search_insights",
+        description="Search for relevant insights based on content and situation",
+        inputSchema=_SEARCH_INSIGHTS_SCHEMA,
+    ),
+    Tool(
+        name="hippo_modify_insight",
+        description="Modify an existing insight's content, situation, or importance",
+        inputSchema=_MODIFY_INSIGHT_SCHEMA,
+    ),
+    Tool(
+        name="hippo_reinforce_insight",
+        description="Apply reinforcement feedback to multiple insights",
+        inputSchema=_REINFORCE_INSIGHT_SCHEMA,
+    ),
+]
+
+
 class HippoServer:
     """MCP server for Hippo insight management."""
     
@@ -138,6 +562,16 @@ class HippoServer:
         self.tool_call_count = 0
         self.metrics_interval = 10
         
+        # 💡: Indented output is friendlier for humans reading transcripts; compact
+        # output is smaller and faster to produce for clients that just parse it
+        compact = os.environ.get('HIPPO_COMPACT_JSON') == '1'
+        self._json_options = 0 if compact else orjson.OPT_INDENT_2
+
+        # Accesses recorded by searches but not yet persisted, with the active day each
+        # search ran on; see _queue_accesses
+        self._pending_accesses: List[Tuple[UUID, int]] = []
+        self._access_flush_task: Optional[asyncio.Task[None]] = None
+
         self.logger.info("server.init.tools", status="registering")
         # Register MCP tools
         self._register_tools()
@@ -148,275 +582,164 @@ class HippoServer:
         return self
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Context manager exit - cleanup storage resources."""
+        """Context manager exit - clean up storage and write out buffered logs."""
+        if self._pending_accesses or self._access_flush_task is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # The loop that queued them is gone; its flush task can never run
+                self._access_flush_task = None
+                asyncio.run(self.flush_accesses())
+            else:
+                # A synchronous exit can't wait for the flush inside a running loop
+                self.logger.warning(
+                    "server.exit.accesses_pending",
+                    count=len(self._pending_accesses),
+                    hint="use 'async with' to flush queued accesses on exit",
+                )
         if hasattr(self.storage, '__exit__'):
             self.storage.__exit__(exc_type, exc_val, exc_tb)
+        shutdown_logging()
         return None  # Don't suppress exceptions
+
+    async def __aenter__(self) -> 'HippoServer':
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit - persist queued accesses, then clean up."""
+        await self.flush_accesses()
+        self.__exit__(exc_type, exc_val, exc_tb)
     
     def _register_tools(self) -> None:
         """Register all MCP tools."""
         self.logger.debug("server.tools.register", status="starting")
         
-        @self.server.list_tools()  # type: ignore[misc,no-untyped-call]
-        async def list_tools() -> List[Tool]:
-            """List available tools."""
-            self.logger.debug("server.tools.list", status="listing")
-            return [
-                Tool(
-                    name="hippo_record_insight",
-                    description="Record a new insight during consolidation moments",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "content": {
-                                "type": "string",
-                                "description": "The insight content - should be atomic and actionable"
-                            },
-                            "situation": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": (
-                                    "Array of independent situational aspects describing when/where "
-                                    "this insight occurred. Include: 1) General activity (e.g. "
-                                    "'debugging authentication flow', 'design discussion about hippo'), "
-                                    "2) Specific problem/goal (e.g. 'users getting logged out randomly', "
-                                    "'defining MCP tool interface'), 3) Additional relevant details "
-                                    "(e.g. 'race condition suspected', 'comparing dialogue vs instruction "
-                                    "formats'). Each element should be independently meaningful for "
-                                    "search matching."
-                                )
-                            },
-                            "importance": {
-                                "type": "number",
-                                "minimum": 0,
-                                "maximum": 1,
-                                "description": (
-                                    "AI-assessed importance rating: 0.8+ breakthrough insights, "
-                                    "0.6-0.7 useful decisions, 0.4-0.5 incremental observations, "
-                                    "0.1-0.3 routine details"
-                                )
-                            }
-                        },
-                        "required": ["content", "situation", "importance"]
-                    }
-                ),
-                Tool(
-                    name="hippo_search_insights",
-                    description="Search for relevant insights based on content and situation",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query for insight content"
-                            },
-                            "situation_filter": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": (
-                                    "Filter results by matching any situation elements using partial "
-                                    "matching. Examples: ['debugging authentication'] matches insights "
-                                    "with 'debugging authentication flow', ['users getting logged out'] "
-                                    "matches specific problem contexts. Can provide multiple filters - "
-                                    "results match if ANY situation element partially matches ANY filter."
-                                )
-                            },
-                            "limit": {
-                                "type": "object",
-                                "properties": {
-                                    "offset": {"type": "integer", "default": 0},
-                                    "count": {"type": "integer", "default": 10}
-                                },
-                                "description": (
-                                    "Result pagination. Default: {offset: 0, count: 10} returns "
-                                    "first 10 results. Examples: {offset: 10, count: 5} for next 5 results"
-                                ),
-                                "default": {"offset": 0, "count": 10}
-                            },
-                            "relevance_range": {
-                                "type": "object",
-                                "properties": {
-                                    "min": {"type": "number", "default": 0.1},
-                                    "max": {"type": "number"}
-                                },
-                                "description": (
-                                    "Relevance range filter. Examples: {min: 0.6, max: 1.0} for highly "
-                                    "relevant insights, {min: 1.0} for top-tier results, {max: 0.4} "
-                                    "for lower relevance insights"
-                                )
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="hippo_modify_insight",
-                    description="Modify an existing insight's content, situation, or importance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "uuid": {
-                                "type": "string",
-                                "description": "UUID of the insight to modify"
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "New insight content (optional - only provide if changing)"
-                            },
-                            "situation": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "New situational aspects array (optional - only provide if changing)"
-                            },
-                            "importance": {
-                                "type": "number",
-                                "minimum": 0,
-                                "maximum": 1,
-                                "description": "New importance rating (optional - only provide if changing)"
-                            },
-                            "reinforce": {
-                                "type": "string",
-                                "enum": ["upvote", "downvote", "none"],
-                                "description": (
-                                    "Reinforcement to apply with modification. Default: 'upvote' "
-                                    "(since modification usually signals value)"
-                                ),
-                                "default": "upvote"
-                            }
-                        },
-                        "required": ["uuid"]
-                    }
-                ),
-                Tool(
-                    name="hippo_reinforce_insight",
-                    description="Apply reinforcement feedback to multiple insights",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "upvotes": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of UUIDs to upvote (1.5x importance multiplier)",
-                                "default": []
-                            },
-                            "downvotes": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of UUIDs to downvote (0.5x importance multiplier)",
-                                "default": []
-                            }
-                        }
-                    }
-                ),
-            ]
-        
-        @self.server.call_tool()  # type: ignore[misc,no-untyped-call]
-        async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-            """Handle tool calls."""
-            import time
-            start_time = time.time()
-            
-            # 💡: Log tool requests at INFO level with sanitized arguments for better metrics tracking
-            # Truncate large arguments to keep logs readable while preserving key information
-            def sanitize_value(val: Any) -> Any:
-                if isinstance(val, str) and len(val) > 100:
-                    return f"{val[:100]}..."
-                elif isinstance(val, list):
-                    if len(val) <= 5:
-                        # Small lists: sanitize each item individually
-                        return [sanitize_value(item) for item in val]
-                    else:
-                        # Large lists: show first 5 items with individual sanitization, then count
-                        sanitized_items = [sanitize_value(item) for item in val[:5]]
-                        return sanitized_items + [f"... +{len(val) - 5} more"]
-                else:
-                    return val
-            
-            sanitized_args = {key: sanitize_value(value) for key, value in arguments.items()}
-            
+        # 💡: Dispatch by dict lookup rather than comparing the tool name against each
+        # branch of an if/elif chain on every call
+        self._tool_dispatch: Dict[
+            str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]
+        ] = {
+            "hippo_record_insight": self._record_insight,
+            "hippo_search_insights": self._search_insights,
+            "hippo_modify_insight": self._modify_insight,
+            "hippo_reinforce_insight": self._reinforce_insight,
+        }
+
+        # 💡: Register bound methods instead of closures defined here, so constructing a
+        # server doesn't allocate fresh handler functions capturing self
+        self.server.list_tools()(self._handle_list_tools)  # type: ignore[no-untyped-call]
+        self.server.call_tool()(self._handle_call_tool)  # type: ignore[no-untyped-call]
+
+    async def _handle_list_tools(self) -> List[Tool]:
+        """List available tools."""
+        self.logger.debug("server.tools.list", status="listing")
+        return _TOOLS
+
+    async def _handle_call_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> List[TextContent]:
+        """Handle tool calls."""
+        # 💡: Durations use the integer monotonic counter so wall-clock adjustments
+        # can't skew them
+        start_ns = time.perf_counter_ns()
+
+        # 💡: Request/response logging, its argument sanitizing and the periodic metrics
+        # scan only matter when INFO is enabled - by default only errors are logged
+        info_enabled = logging.getLogger(__name__).isEnabledFor(logging.INFO)
+
+        if info_enabled:
+            sanitized_args = {
+                key: _sanitize_value(value) for key, value in arguments.items()
+            }
             self.logger.info("tool.request", tool=name, args=sanitized_args)
+
+        try:
+            handler = self._tool_dispatch.get(name)
+            if handler is not None:
+                self.logger.debug("tool.dispatch", handler=handler.__name__)
+                result = await handler(arguments)
+            else:
+                self.logger.warning("tool.unknown", tool=name)
+                result = _text(f"Unknown tool: {name}")
             
-            try:
-                result = None
-                if name == "hippo_record_insight":
-                    self.logger.debug("Calling _record_insight")
-                    result = await self._record_insight(arguments)
-                elif name == "hippo_search_insights":
-                    self.logger.debug("Calling _search_insights")
-                    result = await self._search_insights(arguments)
-                elif name == "hippo_modify_insight":
-                    self.logger.debug("Calling _modify_insight")
-                    result = await self._modify_insight(arguments)
-                elif name == "hippo_reinforce_insight":
-                    self.logger.debug("Calling _reinforce_insight")
-                    result = await self._reinforce_insight(arguments)
-                else:
-                    self.logger.warning("tool.unknown", tool=name)
-                    result = [TextContent(type="text", text=f"Unknown tool: {name}")]
-                
+            self.tool_call_count += 1
+
+            if info_enabled:
                 # 💡: Log successful tool responses with timing for performance analysis
-                duration_ms = (time.time() - start_time) * 1000
-                result_summary = "success"
-                if result and len(result) > 0:
-                    # Extract key info from response for metrics
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                result_summary = _SUMMARY_BY_TOOL.get(name, "success")
+                if result:
+                    # Handlers report failures as text starting with "Error"; a prefix
+                    # check avoids scanning the whole response
                     text = result[0].text if hasattr(result[0], 'text') else str(result[0])
-                    if "Error" in text:
+                    if text.startswith("Error"):
                         result_summary = f"error: {text[:50]}..."
-                    elif "UUID:" in text:
-                        result_summary = "created_insight"
-                    elif "insights" in text:
-                        result_summary = "search_results"
-                    elif "Modified" in text:
-                        result_summary = "modified_insight"
-                    elif "reinforcement" in text:
-                        result_summary = "applied_reinforcement"
+                    elif text.startswith("Insight not found"):
+                        result_summary = "insight_not_found"
                 
                 self.logger.info("tool.response", tool=name, result=result_summary, duration_ms=round(duration_ms, 1))
                 
                 # 💡: Periodic metrics logging to track system health and usage patterns
                 # Only log metrics on successful tool calls to avoid noise from errors
-                self.tool_call_count += 1
                 if self.tool_call_count % self.metrics_interval == 0:
                     await self._log_system_metrics()
+
+            return result
                 
-                return result
-                    
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.logger.error("tool.error", tool=name, error=str(e), duration_ms=round(duration_ms, 1), exc_info=True)
-                return [TextContent(type="text", text=f"Error in {name}: {str(e)}")]
+        except Exception as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            self.logger.error(
+                "tool.error",
+                tool=name,
+                error=str(e),
+                duration_ms=round(duration_ms, 1),
+                exc_info=True,
+            )
+            return _text(f"Error in {name}: {str(e)}")
     
     async def _log_system_metrics(self) -> None:
         """Log system metrics for monitoring and analysis."""
         try:
-            all_insights = await self.storage.get_all_insights()
-            current_active_day = await self.storage.get_current_active_day()
+            all_insights, current_active_day = await asyncio.gather(
+                self.storage.get_all_insights(),
+                self.storage.get_current_active_day(),
+            )
             
             # 💡: Calculate aggregate metrics from existing usage tracking infrastructure
             # Leverage the sophisticated frequency/recency calculations already built into insights
             total_insights = len(all_insights)
             
-            # Calculate importance distribution
-            importance_scores = [insight.compute_current_importance() for insight in all_insights]
-            high_importance = len([s for s in importance_scores if s >= 0.8])
-            medium_importance = len([s for s in importance_scores if 0.4 <= s < 0.8])
-            low_importance = len([s for s in importance_scores if s < 0.4])
-            
-            # Calculate access patterns over recent window
-            recent_access_counts = []
+            # 💡: One pass over the corpus gathers every metric, rather than separate
+            # passes (and bucket scans) for importance, frequency and recency
+            now = datetime.now(timezone.utc)
+            high_importance = medium_importance = low_importance = 0
+            recently_accessed = 0
             total_accesses = 0
+            total_frequency = 0.0
+            most_accessed = 0.0
             for insight in all_insights:
+                # Importance distribution
+                importance = insight.compute_current_importance(now)
+                if importance >= 0.8:
+                    high_importance += 1
+                elif importance >= 0.4:
+                    medium_importance += 1
+                else:
+                    low_importance += 1
+
+                # Access patterns over recent window
                 frequency = insight.calculate_frequency(current_active_day)
-                recent_access_counts.append(frequency)
+                total_frequency += frequency
+                most_accessed = max(most_accessed, frequency)
                 # Sum all access counts from daily tracking
                 total_accesses += sum(count for _, count in insight.daily_access_counts)
+
+                # Recency distribution
+                if insight.calculate_recency_score(current_active_day) > 0.5:
+                    recently_accessed += 1
             
-            most_accessed = max(recent_access_counts) if recent_access_counts else 0
-            avg_frequency = sum(recent_access_counts) / len(recent_access_counts) if recent_access_counts else 0
-            
-            # Calculate recency distribution
-            recency_scores = [insight.calculate_recency_score(current_active_day) for insight in all_insights]
-            recently_accessed = len([s for s in recency_scores if s > 0.5])
+            avg_frequency = total_frequency / total_insights if total_insights else 0
             
             self.logger.info(
                 "system.metrics",
@@ -440,109 +763,122 @@ class HippoServer:
     
     async def _record_insight(self, args: Dict[str, Any]) -> List[TextContent]:
         """Record a new insight."""
+        try:
+            content, situation, importance = _validate_record_args(args)
+        except ValueError as e:
+            return _text(f"Error recording insight: {str(e)}")
+
+        # 💡: Arguments are validated up front, so only storage I/O can fail here
         try:
             current_active_day = await self.storage.get_current_active_day()
             
             insight = Insight.create(
-                content=args["content"],
-                situation=args["situation"],
-                importance=args["importance"],
+                content=content,
+                situation=situation,
+                importance=importance,
                 current_active_day=current_active_day,
             )
             await self.storage.add_insight(insight)
-            
-            return [TextContent(
-                type="text",
-                text=f"Recorded insight with UUID: {insight.uuid}"
-            )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error recording insight: {str(e)}"
-            )]
+        except (OSError, ValueError) as e:
+            return _text(f"Error recording insight: {str(e)}")
+
+        return _text(f"Recorded insight with UUID: {insight.uuid}")
+
+    async def _search_insights_raw(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search for insights and return the response before serialization.
+
+        Raises on invalid arguments; _search_insights turns that into an error message.
+        Values are left as Python objects (e.g. created_at is a datetime).
+        """
+        query, situation_filter, limit, relevance_range = _validate_search_args(args)
+
+        # Perform search
+        # 💡: The insight list and active day come from independent storage reads
+        # (insight files vs metadata), so overlap them
+        all_insights, current_active_day = await asyncio.gather(
+            self.storage.get_all_insights(),
+            self.storage.get_current_active_day(),
+        )
+
+        results = self.searcher.search(
+            insights=all_insights,
+            current_active_day=current_active_day,
+            query=query,
+            situation_filter=situation_filter,
+            relevance_range=relevance_range,
+            limit=limit,
+        )
+
+        # Record accesses for insights that were returned, persisted in the background
+        self._queue_accesses(
+            [r.insight.uuid for r in results.insights], current_active_day
+        )
+
+        # Format results
+        # Read the clock once so every row's ages are measured from the same instant
+        now = datetime.now(timezone.utc)
+        return {
+            "insights": [
+                {
+                    "uuid": r.insight.uuid_str,
+                    "content": r.insight.content,
+                    "situation": r.insight.situation,
+                    "base_importance": r.insight.importance,
+                    "current_importance": r.importance,
+                    "relevance": r.relevance,
+                    "created_at": r.insight.created_at,
+                    "days_since_created": r.insight.days_since_created(now),
+                    "days_since_importance_modified": (
+                        r.insight.days_since_importance_modified(now)
+                    ),
+                }
+                for r in results.insights
+            ],
+            "total_matching": results.total_matching,
+            "returned_count": results.returned_count,
+            "relevance_distribution": results.relevance_distribution,
+        }
     
     async def _search_insights(self, args: Dict[str, Any]) -> List[TextContent]:
         """Search for insights."""
         try:
-            # Parse arguments
-            query = args.get("query", "")
-            situation_filter = args.get("situation_filter")
-            limit_dict = args.get("limit", {"offset": 0, "count": 10})
-            limit = (limit_dict["offset"], limit_dict["count"])
-            
-            relevance_range = None
-            if "relevance_range" in args:
-                rr = args["relevance_range"]
-                relevance_range = (rr.get("min", 0.1), rr.get("max"))
-            
-            # Perform search
-            all_insights = await self.storage.get_all_insights()
-            current_active_day = await self.storage.get_current_active_day()
-            
-            results = self.searcher.search(
-                insights=all_insights,
-                current_active_day=current_active_day,
-                query=query,
-                situation_filter=situation_filter,
-                relevance_range=relevance_range,
-                limit=limit,
-            )
-            
-            # Record accesses for insights that were returned
-            for search_result in results.insights:
-                await self.storage.record_insight_access(search_result.insight.uuid)
-            
-            # Format results
-            output = {
-                "insights": [
-                    {
-                        "uuid": str(r.insight.uuid),
-                        "content": r.insight.content,
-                        "situation": r.insight.situation,
-                        "base_importance": r.insight.importance,
-                        "current_importance": r.importance,
-                        "relevance": r.relevance,
-                        "created_at": r.insight.created_at.isoformat(),
-                        "days_since_created": r.insight.days_since_created(),
-                        "days_since_importance_modified": r.insight.days_since_importance_modified(),
-                    }
-                    for r in results.insights
-                ],
-                "total_matching": results.total_matching,
-                "returned_count": results.returned_count,
-                "relevance_distribution": results.relevance_distribution,
-            }
+            output = await self._search_insights_raw(args)
             
-            import json
-            return [TextContent(
-                type="text",
-                text=json.dumps(output, indent=2)
-            )]
+            # 💡: orjson is several times faster than stdlib json and formats datetimes
+            # natively (same output as isoformat()); large result sets are serialized on
+            # a worker thread so they don't stall other concurrent tool calls
+            if len(output["insights"]) >= SERIALIZE_IN_THREAD_MIN_RESULTS:
+                json_bytes = await asyncio.to_thread(
+                    orjson.dumps, output, option=self._json_options
+                )
+            else:
+                json_bytes = orjson.dumps(output, option=self._json_options)
+            return _text(json_bytes.decode())
             
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error searching insights: {str(e)}"
-            )]
+            return _text(f"Error searching insights: {str(e)}")
     
     async def _modify_insight(self, args: Dict[str, Any]) -> List[TextContent]:
         """Modify an existing insight."""
         try:
             uuid = UUID(args["uuid"])
-            insights = await self.storage.get_all_insights()
             
-            # Find the insight
-            insight = None
-            for i in insights:
-                if i.uuid == uuid:
-                    insight = i
-                    break
+            # 💡: Nothing to change means no storage work at all - clients send these as
+            # pings, so the UUID is only checked for syntax, not looked up
+            reinforce = args.get("reinforce", "upvote")
+            has_changes = reinforce in ("upvote", "downvote") or any(
+                args.get(field) is not None
+                for field in ("content", "situation", "importance")
+            )
+            if not has_changes:
+                return _text(f"Modified insight: {uuid}")
+
+            # 💡: Direct lookup instead of scanning every insight for a single UUID
+            insight = await self.storage.get_insight(uuid)
             
             if insight is None:
-                return [TextContent(
-                    type="text",
-                    text=f"Insight not found: {uuid}"
-                )]
+                return _text(f"Insight not found: {uuid}")
             
             # Update fields
             insight.update_content(
@@ -552,7 +888,6 @@ class HippoServer:
             )
             
             # Apply reinforcement
-            reinforce = args.get("reinforce", "upvote")
             if reinforce == "upvote":
                 insight.apply_reinforcement(UPVOTE_MULTIPLIER)
             elif reinforce == "downvote":
@@ -561,60 +896,172 @@ class HippoServer:
             # Save the updated insight
             await self.storage.store_insight(insight)
             
-            return [TextContent(
-                type="text",
-                text=f"Modified insight: {uuid}"
-            )]
+            return _text(f"Modified insight: {uuid}")
             
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error modifying insight: {str(e)}"
-            )]
+            return _text(f"Error modifying insight: {str(e)}")
     
     async def _reinforce_insight(self, args: Dict[str, Any]) -> List[TextContent]:
         """Apply reinforcement to multiple insights."""
         try:
-            upvotes = [UUID(u) for u in args.get("upvotes", [])]
-            downvotes = [UUID(d) for d in args.get("downvotes", [])]
+            upvotes = _parse_uuid_set(args.get("upvotes", []))
+            # An insight listed in both upvotes and downvotes gets the upvote
+            downvotes = _parse_uuid_set(args.get("downvotes", [])) - upvotes
             
-            insights = await self.storage.get_all_insights()
+            # 💡: Look up only the voted insights so the cost scales with the number
+            # of votes rather than the size of the corpus
             modified = []
+            # Read the clock once so every vote in the batch decays and stamps alike
+            now = datetime.now(timezone.utc)
+            votes = ((upvotes, UPVOTE_MULTIPLIER), (downvotes, DOWNVOTE_MULTIPLIER))
+            for uuids, multiplier in votes:
+                for uuid in uuids:
+                    insight = await self.storage.get_insight(uuid)
+                    if insight is not None:
+                        insight.apply_reinforcement(multiplier, now)
+                        modified.append(insight)
             
-            for insight in insights:
-                if insight.uuid in upvotes:
-                    insight.apply_reinforcement(UPVOTE_MULTIPLIER)
-                    modified.append(str(insight.uuid))
-                    await self.storage.store_insight(insight)
-                elif insight.uuid in downvotes:
-                    insight.apply_reinforcement(DOWNVOTE_MULTIPLIER)
-                    modified.append(str(insight.uuid))
-                    await self.storage.store_insight(insight)
+            # 💡: Persist all reinforced insights in one batch, not one write each
+            if modified:
+                await self.storage.store_insights(modified)
             
-            return [TextContent(
-                type="text",
-                text=f"Applied reinforcement to {len(modified)} insights"
-            )]
+            return _text(f"Applied reinforcement to {len(modified)} insights")
             
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error applying reinforcement: {str(e)}"
-            )]
+            return _text(f"Error applying reinforcement: {str(e)}")
     
+    def _queue_accesses(self, uuids: List[UUID], current_active_day: int) -> None:
+        """Queue accesses made on the given day for a background flush."""
+        if not uuids:
+            return
+
+        # 💡: Keep the day the search ran on; the flush may happen after the active
+        # day has moved on, and the accesses belong to the day they were made
+        self._pending_accesses.extend((uuid, current_active_day) for uuid in uuids)
+        if self._access_flush_task is None:
+            self._access_flush_task = asyncio.create_task(self._flush_accesses_later())
+
+    async def _flush_accesses_later(self) -> None:
+        """Persist queued accesses after a delay so a burst of searches shares one."""
+        await asyncio.sleep(ACCESS_FLUSH_DELAY_SECONDS)
+        # Clear the handle first so searches during the flush schedule another one
+        self._access_flush_task = None
+        try:
+            await self.flush_accesses()
+        except Exception as e:
+            # flush_accesses re-queued them; the next search or shutdown retries
+            self.logger.error(
+                "server.access_flush.error",
+                error=str(e),
+                pending=len(self._pending_accesses),
+                exc_info=True,
+            )
+
+    async def flush_accesses(self) -> None:
+        """
+        Persist any queued insight accesses immediately.
+
+        Accesses that could not be written are queued again before the error propagates.
+        """
+        if self._access_flush_task is not None:
+            self._access_flush_task.cancel()
+            self._access_flush_task = None
+
+        if not self._pending_accesses:
+            return
+
+        pending, self._pending_accesses = self._pending_accesses, []
+        by_day: Dict[int, List[UUID]] = {}
+        for uuid, day in pending:
+            by_day.setdefault(day, []).append(uuid)
+
+        days = list(by_day)
+        for n, day in enumerate(days):
+            try:
+                await self.storage.record_insight_accesses(by_day[day], day)
+            except BaseException:
+                # Put the unwritten days back ahead of anything queued meanwhile
+                self._pending_accesses[:0] = [
+                    (uuid, unwritten)
+                    for unwritten in days[n:]
+                    for uuid in by_day[unwritten]
+                ]
+                raise
+
     async def run(self) -> None:
         """Run the MCP server."""
         self.logger.info("server.run.start", status="starting")
+
+        # 💡: MCP clients stop stdio servers with SIGTERM, which skips atexit hooks and
+        # finally blocks. Turn it into a stop request instead, so the cleanup below
+        # still runs; the process then terminates as SIGTERM would.
+        loop = asyncio.get_running_loop()
+        stop_requested = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, stop_requested.set)
+        except NotImplementedError:
+            # Event loops on Windows don't support signal handlers
+            signal.signal(
+                signal.SIGTERM,
+                lambda signum, frame: loop.call_soon_threadsafe(stop_requested.set),
+            )
+
         try:
             # 💡: Using create_initialization_options() like the official examples
             # This sets up proper server capabilities and initialization parameters
             options = self.server.create_initialization_options()
-            async with stdio_server() as (read_stream, write_stream):
-                self.logger.info("server.run.connected", status="connected", mode="stdio")
-                await self.server.run(read_stream, write_stream, options, raise_exceptions=True)
+            await self.storage.connect()
+            serving = asyncio.create_task(self._serve_stdio(options))
+            stopping = asyncio.create_task(stop_requested.wait())
+            await asyncio.wait(
+                {serving, stopping}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if serving.done():
+                stopping.cancel()
+                await serving  # Re-raise anything the server failed with
+            else:
+                # 💡: Don't wait for the stdio transport to wind down: its reader thread
+                # stays blocked on stdin until the client closes it. Terminating the
+                # process below ends it.
+                self.logger.info("server.run.terminated", signal="SIGTERM")
         except Exception as e:
             self.logger.error("server.run.error", error=str(e), exc_info=True)
             raise
+        finally:
+            # Don't lose access counts queued by the last searches
+            await self.flush_accesses()
+            await self.storage.disconnect()
+
+        if stop_requested.is_set():
+            # Write out buffered logs last, once cleanup has logged what it did
+            _flush_logs_and_terminate()
+
+    async def _serve_stdio(self, options: InitializationOptions) -> None:
+        """Serve MCP requests over stdin/stdout until the client disconnects."""
+        async with stdio_server() as (read_stream, write_stream):
+            self.logger.info("server.run.connected", status="connected", mode="stdio")
+            await self.server.run(
+                read_stream, write_stream, options, raise_exceptions=True
+            )
+
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run the server coroutine on the best event loop available for this platform."""
+    if sys.platform == "win32":
+        # 💡: The default Proactor loop on Windows burns CPU while a stdio server sits
+        # idle waiting for requests; the selector loop waits quietly. stdio is read via
+        # worker threads, so nothing here needs Proactor-only features.
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.run(main)
+        return
+
+    # 💡: uvloop (the optional "fast" extra) moves loop scheduling and I/O dispatch
+    # into C
+    try:
+        import uvloop  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
 
 
 @click.command()
@@ -653,9 +1100,10 @@ def main(memory_dir: Path) -> None:
         memory_dir.parent.mkdir(parents=True, exist_ok=True)
         _logger.debug("hippo.main.dir_check", parent_dir=str(memory_dir.parent), status="exists")
         
-        server = HippoServer(memory_dir, logger=_logger)
-        _logger.info("hippo.main.server_created", status="ready")
-        asyncio.run(server.run())
+        # Exiting the server stops file watching and writes out buffered logs
+        with HippoServer(memory_dir, logger=_logger) as server:
+            _logger.info("hippo.main.server_created", status="ready")
+            _run_event_loop(server.run())
     except Exception as e:
         _logger.error("hippo.main.error", error=str(e), exc_info=True)
         sys.exit(1)
@@ -2,73 +2,340 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+from uuid import UUID
 
-import aiofiles
+import orjson
 
 from .models import HippoStorage, Insight
 
+logger = logging.getLogger(__name__)
+
+
+def _atomic_write_sync(file_path: Path, content: bytes) -> None:
+    """Write content to file_path via a uniquely named temp file and os.replace()."""
+    # 💡: The temp file lives in the same directory so the replace stays on one
+    # filesystem, and os.replace() (unlike Path.rename) overwrites the target on
+    # Windows too
+    temp_fd, temp_path = tempfile.mkstemp(
+        suffix='.tmp',
+        prefix=f'{file_path.stem}_',
+        dir=file_path.parent
+    )
+
+    try:
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(content)
+
+        # Atomic rename
+        os.replace(temp_path, file_path)
+    except Exception:
+        # Clean up temp file if something went wrong
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _append_sync(file_path: Path, content: bytes) -> None:
+    """Append content to file_path, creating it if needed."""
+    with open(file_path, 'ab') as f:
+        f.write(content)
+
 
 class JsonStorage:
-    """Async JSON file storage for insights."""
+    """
+    Async JSON file storage for insights.
     
-    def __init__(self, file_path: Path) -> None:
-        """Initialize storage with file path."""
+    💡: Each file operation is a single asyncio.to_thread() call rather than a
+    sequence of aiofiles awaits, each of which hops to a worker thread and back.
+    """
+
+    def __init__(self, file_path: Path, write_delay_seconds: float = 0.0) -> None:
+        """
+        Initialize storage with file path.
+
+        Args:
+            file_path: JSON file holding all insights
+            write_delay_seconds: If positive, mutations return before their log
+                records reach disk (write-behind) and compactions triggered within
+                this window are coalesced into a single file rewrite; call flush()
+                or disconnect() to make everything durable
+        """
         self.file_path = file_path
         self._data: Optional[HippoStorage] = None
+
+        # 💡: Mutations append one JSON line per insight to a write-ahead log instead of
+        # rewriting the whole file; the log is folded back into the main file once it
+        # grows past half the size of the last full save
+        self._log_path = file_path.with_suffix('.json.log')
+        self._base_bytes = 0
+        self._log_bytes = 0
+
+        # 💡: Set whenever the in-memory data diverges from the main file, so a save
+        # with nothing new to fold in skips re-serializing every insight
+        self._dirty = False
+
+        # 💡: Compaction rewrites the whole file, so bursts of edits are coalesced into
+        # one delayed save; readers always see the in-memory data in the meantime
+        self.write_delay_seconds = write_delay_seconds
+        self._save_task: Optional[asyncio.Task[None]] = None
+
+        # 💡: Concurrent mutations queue their log lines and share one append per
+        # event-loop tick; the lock keeps a compaction from truncating lines appended
+        # after its snapshot was taken
+        self._pending_log: list[tuple[UUID, bytes, bytes]] = []
+        self._log_flush: Optional[asyncio.Future[None]] = None
+        self._write_lock = asyncio.Lock()
+
+        # 💡: Digest of each insight's JSON as last written to the log, so re-storing an
+        # unchanged insight (retries, resyncs) skips the write entirely. Recorded only
+        # once the append succeeds, so a failed write is retried rather than skipped.
+        self._logged_digests: Dict[UUID, bytes] = {}
+
+        # 💡: Callers racing on the first load share one read and parse of the file
+        self._load_future: Optional[asyncio.Future[HippoStorage]] = None
     
     async def load(self) -> HippoStorage:
         """Load insights from JSON file, creating if necessary."""
         if self._data is not None:
             return self._data
-            
+
+        future = self._load_future
+        if future is None:
+            future = self._load_future = asyncio.ensure_future(self._load_from_disk())
+            # Cleared once done; on success _data is set, and after a failure the next
+            # call retries
+            future.add_done_callback(self._clear_load_future)
+        # Shield the shared load so one cancelled caller doesn't cancel it for all
+        return await asyncio.shield(future)
+
+    def _clear_load_future(self, future: asyncio.Future[HippoStorage]) -> None:
+        """Forget a finished load."""
+        self._load_future = None
+
+    async def _load_from_disk(self) -> HippoStorage:
+        """Read the main file and replay the write-ahead log over it."""
+        # Only published as self._data once the log is replayed, so callers taking the
+        # fast path in load() never see a half-loaded store
         if not self.file_path.exists():
-            self._data = HippoStorage()
+            data = HippoStorage()
+            await self._replay_log(data)
+            self._data = data
+            self._dirty = True
             await self.save()
-            return self._data
+            return data
         
         try:
-            async with aiofiles.open(self.file_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-                self._data = HippoStorage.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
-            # If file is corrupted, start fresh but backup the old one
+            content = await asyncio.to_thread(self.file_path.read_bytes)
+            # 💡: Validate straight from the bytes so pydantic-core parses the file
+            # itself, without an intermediate dict tree the size of the whole store
+            data = HippoStorage.model_validate_json(content)
+            self._base_bytes = len(content)
+        except ValueError as e:
+            # If file is corrupted, start fresh but backup the old one (pydantic's
+            # ValidationError, raised for malformed JSON too, is a ValueError)
             backup_path = self.file_path.with_suffix('.json.backup')
-            self.file_path.rename(backup_path)
-            self._data = HippoStorage()
+            os.replace(self.file_path, backup_path)
+            data = HippoStorage()
+            await self._replay_log(data)
+            self._data = data
+            self._dirty = True
             await self.save()
+            return data
+
+        await self._replay_log(data)
+        self._data = data
+        return data
+
+    async def _replay_log(self, data: HippoStorage) -> None:
+        """Apply changes recorded in the write-ahead log since the last full save."""
+        if not self._log_path.exists():
+            return
+
+        content = await asyncio.to_thread(self._log_path.read_bytes)
+        self._log_bytes = len(content)
+        self._dirty = self._log_bytes > 0
+
+        for line in content.splitlines():
+            try:
+                record = orjson.loads(line)
+                insight = Insight.model_validate(record["insight"])
+            except (orjson.JSONDecodeError, ValueError, KeyError, TypeError):
+                # A crash mid-append can leave a torn last line; skip it
+                continue
+
+            # Every record carries the full insight, so replay is an upsert
+            data.remove_by_uuid(insight.uuid)
+            await data.add_insight(insight)
+
+    async def _append_log(self, op: str, insights: list[Insight]) -> None:
+        """
+        Queue one log record per changed insight and wait for the batch holding them
+        to be written.
+        """
+        queued = False
+        for insight in insights:
+            insight_json = insight.model_dump_json().encode()
+            digest = hashlib.blake2b(insight_json, digest_size=16).digest()
+            if self._logged_digests.get(insight.uuid) == digest:
+                continue
             
-        return self._data
+            record = b'{"op":"' + op.encode() + b'","insight":' + insight_json + b'}\n'
+            self._pending_log.append((insight.uuid, digest, record))
+            queued = True
+
+        if not queued:
+            return
+        self._dirty = True
+
+        if self._log_flush is None:
+            self._log_flush = asyncio.ensure_future(self._write_pending_log())
+            if self.write_delay_seconds > 0:
+                self._log_flush.add_done_callback(self._recover_write_behind)
+
+        # 💡: With a write delay the in-memory data is already updated, so return
+        # without waiting for the append; flush() waits for it
+        if self.write_delay_seconds > 0:
+            return
+        # Shield the shared write so one cancelled caller doesn't cancel it for all
+        await asyncio.shield(self._log_flush)
+
+    def _recover_write_behind(self, future: asyncio.Future[None]) -> None:
+        """Log a failed write-behind append and schedule a full save in its place."""
+        if future.cancelled() or future.exception() is None:
+            return
+
+        # 💡: No caller is waiting on a write-behind append, so this is the only place
+        # the failure can surface. The changes are still in memory and marked dirty,
+        # so a full save gets them to disk.
+        logger.error(
+            "Write-behind log append failed; scheduling a full save",
+            exc_info=future.exception(),
+        )
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _write_pending_log(self) -> None:
+        """
+        Append queued log records in batches until none are left, then compact if the
+        log has grown too large.
+        """
+        try:
+            # Yield once so mutations made in the same event-loop tick join this batch
+            await asyncio.sleep(0)
+            # Records queued while a batch is being written go out in the next one, so
+            # everyone awaiting this flush has their records on disk when it finishes
+            while self._pending_log:
+                entries, self._pending_log = self._pending_log, []
+                batch = b"".join(record for _, _, record in entries)
+
+                async with self._write_lock:
+                    self._log_path.parent.mkdir(parents=True, exist_ok=True)
+                    await asyncio.to_thread(_append_sync, self._log_path, batch)
+                    self._log_bytes += len(batch)
+                    # Lines queued before a compaction's snapshot can land after it;
+                    # keep the log non-empty implying dirty so the next save still
+                    # clears them
+                    self._dirty = True
+
+                for uuid, digest, _ in entries:
+                    self._logged_digests[uuid] = digest
+        finally:
+            self._log_flush = None
+
+        if self._log_bytes > self._base_bytes / 2:
+            await self._mark_dirty()
     
     async def save(self) -> None:
-        """Save current insights to JSON file."""
+        """Save current insights to JSON file and clear the write-ahead log."""
         if self._data is None:
             return
             
-        # Ensure directory exists
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write to temporary file first for atomicity
-        temp_path = self.file_path.with_suffix('.json.tmp')
-        
-        async with aiofiles.open(temp_path, 'w') as f:
+        async with self._write_lock:
+            if not self._dirty:
+                return
+            # Cleared before the snapshot is taken, so changes made while it is being
+            # written mark the data dirty again
+            self._dirty = False
+
+            # Ensure directory exists
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Serialize here rather than in the worker thread so the snapshot can't
+            # interleave with mutations made on the event loop
             json_data = self._data.model_dump_json(
                 indent=2,
                 by_alias=False,
-            )
-            await f.write(json_data)
+            ).encode()
+
+            # Write to temporary file first for atomicity
+            await asyncio.to_thread(_atomic_write_sync, self.file_path, json_data)
+            self._base_bytes = len(json_data)
+
+            # Everything in the log is now part of the main file. A crash before this
+            # truncation only means the log is replayed again, which is idempotent.
+            if self._log_bytes or self._log_path.exists():
+                await asyncio.to_thread(self._log_path.write_bytes, b"")
+                self._log_bytes = 0
+
+    async def compact(self) -> None:
+        """Fold the write-ahead log into the main JSON file now."""
+        if self._save_task is not None:
+            self._save_task.cancel()
+            self._save_task = None
+        await self.save()
+
+    async def connect(self) -> None:
+        """Load the insights file up front for a server session."""
+        await self.load()
+
+    async def disconnect(self) -> None:
+        """Write any coalesced changes before the session ends."""
+        await self.flush()
+
+    async def _mark_dirty(self) -> None:
+        """Compact now, or schedule a coalesced compaction if a write delay is set."""
+        if self.write_delay_seconds <= 0:
+            await self.save()
+            return
         
-        # Atomic rename
-        temp_path.rename(self.file_path)
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """Save after the write delay, picking up every change made in the meantime."""
+        await asyncio.sleep(self.write_delay_seconds)
+        # Clear the handle before saving so changes made during the save schedule
+        # another one
+        self._save_task = None
+        await self.save()
+
+    async def flush(self) -> None:
+        """Wait for queued log records, then run any pending coalesced compaction."""
+        if self._log_flush is not None:
+            await asyncio.shield(self._log_flush)
+
+        task = self._save_task
+        if task is None:
+            return
+
+        task.cancel()
+        self._save_task = None
+        await self.save()
     
     async def add_insight(self, insight: Insight) -> None:
-        """Add an insight and save to disk."""
+        """Add an insight and record it in the write-ahead log."""
         data = await self.load()
         await data.add_insight(insight)
-        await self.save()
+        await self._append_log("add", [insight])
     
     async def update_insight(self, insight: Insight) -> bool:
         """Update an existing insight. Returns True if found."""
@@ -80,9 +347,28 @@ class JsonStorage:
         # Replace with updated version
         data.remove_by_uuid(insight.uuid)
         await data.add_insight(insight)
-        await self.save()
+        await self._append_log("update", [insight])
         return True
     
+    async def update_insights(self, insights: list[Insight]) -> int:
+        """
+        Update several existing insights with a single log append.
+
+        Returns the number found.
+        """
+        data = await self.load()
+        updated = []
+        for insight in insights:
+            if data.find_by_uuid(insight.uuid) is None:
+                continue
+            data.remove_by_uuid(insight.uuid)
+            await data.add_insight(insight)
+            updated.append(insight)
+
+        if updated:
+            await self._append_log("update", updated)
+        return len(updated)
+
     async def get_all_insights(self) -> list[Insight]:
         """Get all insights from storage."""
         data = await self.load()
@@ -1,6 +1,6 @@
 """Storage protocol interface for Hippo storage implementations."""
 
-from typing import Any, List, Protocol
+from typing import Any, List, Optional, Protocol
 from uuid import UUID
 
 from .models import Insight
@@ -13,10 +13,22 @@ class StorageProtocol(Protocol):
     and any future storage implementations.
     """
     
+    async def connect(self) -> None:
+        """Prepare storage for a server session (e.g. warm caches)."""
+        ...
+
+    async def disconnect(self) -> None:
+        """Release session resources and persist anything still pending."""
+        ...
+
     async def get_all_insights(self) -> List[Insight]:
         """Get all insights from storage."""
         ...
     
+    async def get_insight(self, uuid: UUID) -> Optional[Insight]:
+        """Get a single insight by UUID, or None if it doesn't exist."""
+        ...
+
     async def get_current_active_day(self) -> int:
         """Get the current active day counter."""
         ...
@@ -33,10 +45,29 @@ class StorageProtocol(Protocol):
         """
         ...
     
+    async def store_insights(self, insights: List[Insight]) -> List[str]:
+        """Store/update several insights in one batch.
+
+        Returns:
+            UUID strings of the stored insights, in order
+        """
+        ...
+
     async def record_insight_access(self, uuid: UUID) -> None:
         """Record that an insight was accessed."""
         ...
     
+    async def record_insight_accesses(
+        self, uuids: List[UUID], current_active_day: Optional[int] = None
+    ) -> None:
+        """
+        Record that several insights were accessed, persisting them in one batch.
+
+        The accesses are counted on current_active_day, or on the current active day
+        if it is None.
+        """
+        ...
+
     def __enter__(self) -> 'StorageProtocol':
         """Context manager entry."""
         ...
@@ -2,8 +2,10 @@
 
 import asyncio
 import tempfile
+import threading
 from pathlib import Path
-from uuid import uuid4
+from typing import Dict, Set
+from uuid import UUID, uuid4
 
 from .file_storage import FileBasedStorage
 from .models import Insight
@@ -152,12 +154,208 @@ async def test_file_watching_enabled() -> None:
         print("✓ File watching enabled/disabled cleanly")
 
 
+async def test_cross_process_changes_visible_without_watching() -> None:
+    """Test that another storage instance's changes are seen via directory mtime."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as reader, \
+             FileBasedStorage(Path(temp_dir), enable_watching=False) as writer:
+
+            # Prime the reader's cache while the store is empty
+            assert await reader.get_all_insights() == []
+
+            insight = Insight.create(
+                content="Written by another process",
+                situation=["testing", "cache invalidation"],
+                importance=0.6,
+                current_active_day=1
+            )
+            await writer.store_insight(insight)
+
+            # 💡: No watchdog events here - the reader must notice the directory mtime
+            # change
+            all_insights = await reader.get_all_insights()
+            assert [i.uuid for i in all_insights] == [insight.uuid]
+
+        print("✓ Cross-process changes are visible without file watching")
+
+
+async def test_invalidate_reloads_in_place_edits() -> None:
+    """Test that invalidate() picks up an insight file edited in place."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as storage:
+
+            insight = Insight.create(
+                content="Original content",
+                situation=["testing"],
+                importance=0.5,
+                current_active_day=1
+            )
+            await storage.store_insight(insight)
+
+            # Rewrite the file in place - this doesn't touch the directory mtime
+            file_path = Path(temp_dir) / "insights" / f"{insight.uuid}.json"
+            edited = file_path.read_text().replace("Original content", "Edited content")
+            file_path.write_text(edited)
+
+            storage.invalidate()
+            retrieved = await storage.get_insight(insight.uuid)
+            assert retrieved is not None
+            assert retrieved.content == "Edited content"
+
+        print("✓ invalidate() reloads in-place edits")
+
+
+async def test_record_insight_accesses() -> None:
+    """Test that batched access recording persists known insights, skips unknown."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as storage:
+
+            day = await storage.get_current_active_day()
+            insights = [
+                Insight.create(
+                    content=f"Insight {i}",
+                    situation=["testing"],
+                    importance=0.5,
+                    current_active_day=day,
+                )
+                for i in range(2)
+            ]
+            await storage.store_insights(insights)
+
+            await storage.record_insight_accesses(
+                [insights[0].uuid, insights[1].uuid, uuid4()]
+            )
+
+        # Read back through a fresh instance to check what reached disk
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as reloaded:
+            for insight in insights:
+                stored = await reloaded.get_insight(insight.uuid)
+                assert stored is not None
+                assert stored.daily_access_counts == [(day, 2)]
+
+        print("✓ Batched access recording works")
+
+
+async def test_search_index_tracks_changes() -> None:
+    """Test that substring search stays correct as insights are updated and deleted."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as storage:
+
+            first = Insight.create(
+                content="Cache invalidation is hard",
+                situation=["design review"],
+                importance=0.5,
+                current_active_day=1,
+            )
+            second = Insight.create(
+                content="Naming things is hard",
+                situation=["code review"],
+                importance=0.5,
+                current_active_day=1,
+            )
+            await storage.store_insights([first, second])
+
+            # Builds the index; matches mid-word and in situation elements
+            async def matches(query: str) -> Set[UUID]:
+                return {i.uuid for i in await storage.search_insights(query)}
+
+            assert await matches("ALIDAT") == {first.uuid}
+            assert await matches("review") == {first.uuid, second.uuid}
+
+            await storage.update_insight(first.uuid, {"content": "Off-by-one errors"})
+            assert await storage.search_insights("invalidation") == []
+            assert await matches("by-one") == {first.uuid}
+
+            await storage.delete_insight(second.uuid)
+            assert await matches("review") == {first.uuid}
+
+            # Queries shorter than a trigram fall back to scanning
+            assert await matches("of") == {first.uuid}
+
+            # Indexed results come back in storage order, like a full scan, not set
+            # order
+            follow_ups = [
+                Insight.create(
+                    content=f"Follow-up {n}",
+                    situation=["review"],
+                    importance=0.5,
+                    current_active_day=1,
+                )
+                for n in range(8)
+            ]
+            await storage.store_insights(follow_ups)
+            expected_order = [first.uuid] + [i.uuid for i in follow_ups]
+            results = await storage.search_insights("review")
+            assert [i.uuid for i in results] == expected_order
+
+        print("✓ Search index tracks updates and deletes")
+
+
+
+async def test_refresh_scans_without_cache_lock() -> None:
+    """Test that a rescan leaves the cache lock free and notices concurrent writes."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with FileBasedStorage(Path(temp_dir), enable_watching=False) as storage:
+
+            insight = Insight.create(
+                content="Refresh test",
+                situation=["testing"],
+                importance=0.5,
+                current_active_day=1,
+            )
+            await storage.store_insight(insight)
+
+            lock_free_during_scan = []
+            original_read = storage._read_insights_from_disk
+
+            def probing_read() -> Dict[str, Insight]:
+                # Probe from another thread, since the lock is reentrant
+                def probe() -> None:
+                    acquired = storage._cache_lock.acquire(blocking=False)
+                    lock_free_during_scan.append(acquired)
+                    if acquired:
+                        storage._cache_lock.release()
+
+                prober = threading.Thread(target=probe)
+                prober.start()
+                prober.join()
+
+                insights = original_read()
+                # Simulate a write landing while the scan is running
+                storage._note_own_write()
+                return insights
+
+            storage._read_insights_from_disk = probing_read  # type: ignore[method-assign]
+            await asyncio.to_thread(storage._refresh_cache_from_disk)
+
+            assert lock_free_during_scan == [True]
+            # The snapshot may have missed the write, so the next read rescans
+            loaded_after_scan = storage._cache_loaded
+            assert not loaded_after_scan
+
+            storage._read_insights_from_disk = original_read  # type: ignore[method-assign]
+            assert await storage.get_insight(insight.uuid) is not None
+            assert storage._cache_loaded
+
+        print("✓ Refresh scans without holding the cache lock")
+
+
 if __name__ == "__main__":
     async def run_tests() -> None:
         await test_basic_operations()
         await test_active_day_tracking() 
         await test_file_structure()
         await test_file_watching_enabled()
+        await test_cross_process_changes_visible_without_watching()
+        await test_invalidate_reloads_in_place_edits()
+        await test_record_insight_accesses()
+        await test_search_index_tracks_changes()
+        await test_refresh_scans_without_cache_lock()
         print("All tests passed!")
     
     asyncio.run(run_tests())
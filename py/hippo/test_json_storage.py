@@ -0,0 +1,272 @@
+"""Tests for JsonStorage's write-ahead log."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import List
+
+from . import storage as storage_module
+from .models import HippoStorage, Insight
+from .storage import JsonStorage
+
+
+def _make_insights(count: int, prefix: str = "Insight") -> List[Insight]:
+    """Create distinct insights for populating a store."""
+    return [
+        Insight.create(
+            content=f"{prefix} {n} about write-ahead logging",
+            situation=["testing", "json storage"],
+            importance=0.5,
+            current_active_day=1,
+        )
+        for n in range(count)
+    ]
+
+
+async def _seeded_storage(file_path: Path, count: int = 10) -> JsonStorage:
+    """
+    Build a store holding `count` compacted insights.
+
+    💡: The log is folded in once it grows past half the main file, so a few insights
+    in the main file leave room to append single records without triggering compaction
+    """
+    storage = JsonStorage(file_path)
+    for insight in _make_insights(count, prefix="Seed"):
+        await storage.add_insight(insight)
+    await storage.compact()
+    return storage
+
+
+async def test_replay_after_restart() -> None:
+    """Test that changes only in the log survive a restart."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        storage = await _seeded_storage(file_path)
+
+        added = _make_insights(1, prefix="Logged")[0]
+        await storage.add_insight(added)
+
+        order = [i.uuid for i in await storage.get_all_insights()]
+        seed = (await storage.get_all_insights())[0]
+        updated = seed.model_copy(update={"content": "Edited seed"})
+        assert await storage.update_insight(updated)
+
+        # An update moves the insight to the end and leaves the rest in order
+        expected_order = [uuid for uuid in order if uuid != updated.uuid]
+        expected_order.append(updated.uuid)
+        assert [i.uuid for i in await storage.get_all_insights()] == expected_order
+
+        # Neither change has been compacted into the main file yet
+        assert storage._log_path.stat().st_size > 0
+        on_disk = HippoStorage.model_validate_json(file_path.read_bytes())
+        assert added.uuid not in {i.uuid for i in on_disk.insights}
+
+        # A fresh instance sees them by replaying the log
+        restarted = JsonStorage(file_path)
+        assert [i.uuid for i in await restarted.get_all_insights()] == expected_order
+        insights = {i.uuid: i for i in await restarted.get_all_insights()}
+        assert len(insights) == 11
+        assert added.uuid in insights
+        assert insights[updated.uuid].content == "Edited seed"
+        print("✓ Log is replayed after a restart")
+
+
+async def test_torn_last_line_is_skipped() -> None:
+    """Test that a partially written final log record is ignored on replay."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        storage = await _seeded_storage(file_path)
+
+        added = _make_insights(1, prefix="Logged")[0]
+        await storage.add_insight(added)
+
+        # Simulate a crash midway through the next append
+        with open(storage._log_path, "ab") as f:
+            f.write(b'{"op":"add","insight":{"uuid":"')
+
+        restarted = JsonStorage(file_path)
+        insights = await restarted.get_all_insights()
+        assert len(insights) == 11
+        assert added.uuid in {i.uuid for i in insights}
+        print("✓ Torn last log line is skipped")
+
+
+async def test_compaction_truncates_log() -> None:
+    """Test that compaction folds the log into the main file and empties it."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        storage = await _seeded_storage(file_path)
+
+        added = _make_insights(1, prefix="Logged")[0]
+        await storage.add_insight(added)
+        assert storage._log_path.stat().st_size > 0
+
+        await storage.compact()
+        assert storage._log_path.stat().st_size == 0
+        on_disk = HippoStorage.model_validate_json(file_path.read_bytes())
+        assert len(on_disk.insights) == 11
+        assert added.uuid in {i.uuid for i in on_disk.insights}
+
+        # Growing the log past half the main file compacts automatically
+        for insight in _make_insights(10, prefix="Burst"):
+            await storage.add_insight(insight)
+        assert storage._log_path.stat().st_size < storage._base_bytes / 2
+        on_disk = HippoStorage.model_validate_json(file_path.read_bytes())
+        assert len(on_disk.insights) > 11
+        print("✓ Compaction truncates the log")
+
+
+async def test_write_behind_flush_and_disconnect() -> None:
+    """Test that write-behind changes reach disk on flush() and disconnect()."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        await (await _seeded_storage(file_path)).disconnect()
+
+        # 💡: A long delay means nothing is compacted unless flush() forces it
+        storage = JsonStorage(file_path, write_delay_seconds=60)
+        added = _make_insights(1, prefix="Logged")[0]
+        await storage.add_insight(added)
+
+        await storage.flush()
+        restarted = JsonStorage(file_path)
+        assert added.uuid in {i.uuid for i in await restarted.get_all_insights()}
+        print("✓ flush() writes queued log records")
+
+        # Enough changes to schedule a delayed compaction
+        burst = _make_insights(10, prefix="Burst")
+        for insight in burst:
+            await storage.add_insight(insight)
+
+        # Adds return before their records are written; the compaction is scheduled
+        # after
+        async def compaction_scheduled() -> None:
+            while storage._save_task is None:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(compaction_scheduled(), timeout=5)
+
+        await storage.disconnect()
+        assert storage._save_task is None
+        assert storage._log_path.stat().st_size == 0
+        on_disk = HippoStorage.model_validate_json(file_path.read_bytes())
+        assert {i.uuid for i in burst} <= {i.uuid for i in on_disk.insights}
+        print("✓ disconnect() runs the pending compaction")
+
+
+async def test_concurrent_adds_share_one_append() -> None:
+    """Test that mutations in the same event-loop tick are written with one append."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        storage = await _seeded_storage(file_path, count=30)
+
+        appends: List[bytes] = []
+        original_append = storage_module._append_sync
+
+        def counting_append(file_path: Path, content: bytes) -> None:
+            appends.append(content)
+            original_append(file_path, content)
+
+        storage_module._append_sync = counting_append
+        try:
+            added = _make_insights(5, prefix="Concurrent")
+            await asyncio.gather(*(storage.add_insight(insight) for insight in added))
+            assert len(appends) == 1
+            assert appends[0].count(b"\n") == 5
+
+            # Re-storing an unchanged insight writes nothing
+            assert await storage.update_insight(added[0])
+            assert len(appends) == 1
+        finally:
+            storage_module._append_sync = original_append
+
+        restarted = JsonStorage(file_path)
+        assert len(await restarted.get_all_insights()) == 35
+        print("✓ Concurrent adds share one append")
+
+
+
+async def test_failed_append_is_retried() -> None:
+    """Test that an update whose log append failed is written again when retried."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        storage = await _seeded_storage(file_path)
+        seed = (await storage.get_all_insights())[0]
+        updated = seed.model_copy(update={"content": "Edited seed"})
+
+        original_append = storage_module._append_sync
+
+        def failing_append(file_path: Path, content: bytes) -> None:
+            raise OSError("disk full")
+
+        storage_module._append_sync = failing_append
+        try:
+            try:
+                await storage.update_insight(updated)
+            except OSError:
+                pass
+            else:
+                raise AssertionError("update_insight should surface the failed append")
+        finally:
+            storage_module._append_sync = original_append
+
+        # The retry is not mistaken for an already-logged change
+        assert await storage.update_insight(updated)
+        assert storage._log_path.stat().st_size > 0
+        restarted = JsonStorage(file_path)
+        insights = {i.uuid: i for i in await restarted.get_all_insights()}
+        assert insights[updated.uuid].content == "Edited seed"
+        print("✓ Failed appends are retried")
+
+
+
+async def test_failed_write_behind_append_is_saved() -> None:
+    """Test that a write-behind change whose append failed still reaches disk."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "insights.json"
+        await (await _seeded_storage(file_path)).disconnect()
+        storage = JsonStorage(file_path, write_delay_seconds=60)
+
+        original_append = storage_module._append_sync
+
+        def failing_append(file_path: Path, content: bytes) -> None:
+            raise OSError("disk full")
+
+        storage_module._append_sync = failing_append
+        try:
+            added = _make_insights(1, prefix="Logged")[0]
+            await storage.add_insight(added)
+
+            # The failed append schedules a full save instead of losing the change
+            async def save_scheduled() -> None:
+                while storage._save_task is None:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(save_scheduled(), timeout=5)
+        finally:
+            storage_module._append_sync = original_append
+
+        await storage.flush()
+        restarted = JsonStorage(file_path)
+        assert added.uuid in {i.uuid for i in await restarted.get_all_insights()}
+        print("✓ Failed write-behind appends fall back to a full save")
+
+
+if __name__ == "__main__":
+    async def run_tests() -> None:
+        await test_replay_after_restart()
+        await test_torn_last_line_is_skipped()
+        await test_compaction_truncates_log()
+        await test_write_behind_flush_and_disconnect()
+        await test_concurrent_adds_share_one_append()
+        await test_failed_append_is_retried()
+        await test_failed_write_behind_append_is_saved()
+        print("All tests passed!")
+
+    asyncio.run(run_tests())
@@ -8,6 +8,7 @@ use anyhow::{anyhow, Context, Result};
 use clap::{Parser, ValueEnum};
 use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::OnceLock;
 
 #[derive(Debug, Clone, ValueEnum)]
 enum CLITool {
@@ -111,16 +112,30 @@ fn main() -> Result<()> {
     // Setup MCP server(s)
     let mut success = true;
     if !args.skip_mcp {
+        // Build (or install) once, even when registering with both tools
+        let repo_root = get_repo_root()?;
+        let binary_path = if args.dev {
+            build_rust_server(&repo_root)?
+        } else {
+            install_rust_server(&repo_root)?
+        };
+
         match tool {
             CLITool::QCli => {
-                success = setup_q_cli_mcp(&memory_dir, args.dev)?;
+                success = setup_q_cli_mcp(&binary_path, &memory_dir, args.dev)?;
             }
             CLITool::ClaudeCode => {
-                success = setup_claude_code_mcp(&memory_dir, &args.claude_scope, args.dev)?;
+                success =
+                    setup_claude_code_mcp(&binary_path, &memory_dir, &args.claude_scope, args.dev)?;
             }
             CLITool::Both => {
-                success = setup_q_cli_mcp(&memory_dir, args.dev)?
-                    && setup_claude_code_mcp(&memory_dir, &args.claude_scope, args.dev)?;
+                success = setup_q_cli_mcp(&binary_path, &memory_dir, args.dev)?
+                    && setup_claude_code_mcp(
+                        &binary_path,
+                        &memory_dir,
+                        &args.claude_scope,
+                        args.dev,
+                    )?;
             }
             CLITool::Auto => unreachable!("Auto should have been resolved earlier"),
         }
@@ -148,7 +163,7 @@ fn check_rust() -> Result<()> {
 }
 
 fn check_q_cli() -> Result<()> {
-    if which::which("q").is_err() {
+    if !is_q_cli_available() {
         return Err(anyhow!(
             "❌ Error: Q CLI not found. Please install Q CLI first.\n   Visit: https://docs.aws.amazon.com/amazonq/latest/qdeveloper-ug/q-cli.html"
         ));
@@ -165,14 +180,40 @@ fn check_claude_code() -> Result<()> {
     Ok(())
 }
 
+// Tool detection and the prerequisite checks ask the same questions; probe PATH and
+// the home directory once per run rather than once per question.
+fn is_q_cli_available() -> bool {
+    static AVAILABLE: OnceLock<bool> = OnceLock::new();
+    *AVAILABLE.get_or_init(|| which::which("q").is_ok())
+}
+
 fn is_claude_available() -> bool {
-    // Check both binary and config directory since claude might be an alias
-    which::which("claude").is_ok()
-        || home::home_dir().is_some_and(|home| home.join(".claude").exists())
+    static AVAILABLE: OnceLock<bool> = OnceLock::new();
+    *AVAILABLE.get_or_init(|| {
+        // Check both binary and config directory since claude might be an alias
+        which::which("claude").is_ok()
+            || home::home_dir().is_some_and(|home| home.join(".claude").exists())
+    })
+}
+
+/// The program to run for Claude Code. `claude` is often a shell alias for the local
+/// install in ~/.claude/local, which isn't on PATH, so we exec that directly instead.
+fn claude_command() -> &'static Path {
+    static COMMAND: OnceLock<PathBuf> = OnceLock::new();
+    COMMAND.get_or_init(|| {
+        if let Ok(path) = which::which("claude") {
+            return path;
+        }
+
+        home::home_dir()
+            .map(|home| home.join(".claude").join("local").join("claude"))
+            .filter(|path| path.exists())
+            .unwrap_or_else(|| PathBuf::from("claude"))
+    })
 }
 
 fn detect_available_tools() -> Result<CLITool> {
-    let has_q = which::which("q").is_ok();
+    let has_q = is_q_cli_available();
     let has_claude = is_claude_available();
 
     match (has_q, has_claude) {
@@ -219,18 +260,17 @@ fn install_rust_server(repo_root: &Path) -> Result<PathBuf> {
     println!("📦 Installing Rust Hippo server to PATH...");
     println!("   Installing from: {}", rust_dir.display());
 
-    // Install the Rust server to ~/.cargo/bin
-    let output = Command::new("cargo")
+    // Install the Rust server to ~/.cargo/bin, letting cargo's progress and
+    // diagnostics stream to the terminal
+    let status = Command::new("cargo")
         .args(["install", "--path", ".", "--force"])
         .current_dir(&rust_dir)
-        .output()
+        .status()
         .context("Failed to execute cargo install")?;
 
-    if !output.status.success() {
-        let stderr = String::from_utf8_lossy(&output.stderr);
+    if !status.success() {
         return Err(anyhow!(
-            "❌ Failed to install Rust server:\n   Error: {}",
-            stderr.trim()
+            "❌ Failed to install Rust server (see cargo output above)"
         ));
     }
 
@@ -269,18 +309,17 @@ fn build_rust_server(repo_root: &Path) -> Result<PathBuf> {
     println!("🔨 Building Rust Hippo server for development...");
     println!("   Building in: {}", rust_dir.display());
 
-    // Build the Rust server
-    let output = Command::new("cargo")
+    // Build the Rust server, letting cargo's progress and diagnostics stream to
+    // the terminal rather than buffering them until the build finishes
+    let status = Command::new("cargo")
         .args(["build", "--release"])
         .current_dir(&rust_dir)
-        .output()
+        .status()
         .context("Failed to execute cargo build")?;
 
-    if !output.status.success() {
-        let stderr = String::from_utf8_lossy(&output.stderr);
+    if !status.success() {
         return Err(anyhow!(
-            "❌ Failed to build Rust server:\n   Error: {}",
-            stderr.trim()
+            "❌ Failed to build Rust server (see cargo output above)"
         ));
     }
 
@@ -297,16 +336,7 @@ fn build_rust_server(repo_root: &Path) -> Result<PathBuf> {
     Ok(binary_path)
 }
 
-fn setup_q_cli_mcp(memory_dir: &Path, dev_mode: bool) -> Result<bool> {
-    let repo_root = get_repo_root()?;
-
-    // Choose build method based on mode
-    let binary_path = if dev_mode {
-        build_rust_server(&repo_root)?
-    } else {
-        install_rust_server(&repo_root)?
-    };
-
+fn setup_q_cli_mcp(binary_path: &Path, memory_dir: &Path, dev_mode: bool) -> Result<bool> {
     // Set log level based on mode
     let log_level = if dev_mode { "debug" } else { "info" };
     let log_env = format!("HIPPO_LOG={}", log_level);
@@ -351,16 +381,12 @@ fn setup_q_cli_mcp(memory_dir: &Path, dev_mode: bool) -> Result<bool> {
     }
 }
 
-fn setup_claude_code_mcp(memory_dir: &Path, scope: &ClaudeScope, dev_mode: bool) -> Result<bool> {
-    let repo_root = get_repo_root()?;
-
-    // Choose build method based on mode
-    let binary_path = if dev_mode {
-        build_rust_server(&repo_root)?
-    } else {
-        install_rust_server(&repo_root)?
-    };
-
+fn setup_claude_code_mcp(
+    binary_path: &Path,
+    memory_dir: &Path,
+    scope: &ClaudeScope,
+    dev_mode: bool,
+) -> Result<bool> {
     // Set log level based on mode
     let log_level = if dev_mode { "debug" } else { "info" };
     let log_env = format!("HIPPO_LOG={}", log_level);
@@ -372,7 +398,7 @@ fn setup_claude_code_mcp(memory_dir: &Path, scope: &ClaudeScope, dev_mode: bool)
     };
 
     // Claude Code uses -- to separate command from its arguments
-    let mut cmd = Command::new("claude");
+    let mut cmd = Command::new(claude_command());
     cmd.args([
         "mcp",
         "add",
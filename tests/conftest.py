@@ -0,0 +1,37 @@
+"""Shared fixtures for Hippo server tests."""
+
+from typing import Callable, Optional
+
+import pytest
+import structlog
+
+from hippo.mocks import InMemoryStorage
+from hippo.search import InsightSearcher
+from hippo.server import HippoServer
+
+
+@pytest.fixture(scope="session")
+def shared_searcher() -> InsightSearcher:
+    """One searcher for the whole session, so the embedding model loads only once."""
+    return InsightSearcher()
+
+
+@pytest.fixture
+def server_factory(shared_searcher: InsightSearcher) -> Callable[..., HippoServer]:
+    """
+    Build servers backed by fresh in-memory storage, or by a given storage to share it.
+
+    💡: Constructing a HippoServer is cheap; loading the sentence transformer behind its
+    searcher is not. Each test gets its own server and storage so no state leaks between
+    tests, while the searcher (and its text-keyed embedding caches) is shared.
+    """
+    def make(
+        initial_active_day: int = 1, storage: Optional[InMemoryStorage] = None
+    ) -> HippoServer:
+        if storage is None:
+            storage = InMemoryStorage(initial_active_day=initial_active_day)
+        server = HippoServer(storage=storage, logger=structlog.get_logger())
+        server.searcher = shared_searcher
+        return server
+
+    return make
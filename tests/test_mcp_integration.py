@@ -14,7 +14,7 @@ async def test_record_and_search_insight():
     # Create temporary storage for file-based testing
     with tempfile.TemporaryDirectory() as temp_dir:
         storage_path = Path(temp_dir) / "hippo_storage"
-        with HippoServer(storage_path=storage_path) as server:
+        async with HippoServer(storage_path=storage_path) as server:
             
             # Record an insight
             record_result = await server._record_insight({
@@ -1,11 +1,17 @@
 """Integration tests for temporal scoring behavior."""
 
-import asyncio
+import json
 import math
+from datetime import datetime
+from functools import cache
 from typing import Dict, Any
+from uuid import UUID
 
-from hippo.server import HippoServer
-from hippo.mocks import InMemoryStorage, TimeController
+import pytest
+
+from hippo.server import SERIALIZE_IN_THREAD_MIN_RESULTS
+from hippo.mocks import TimeController
+from hippo.models import Insight
 from hippo.constants import (
     RECENCY_DECAY_RATE,
     FREQUENCY_WINDOW_DAYS,
@@ -14,24 +20,24 @@ from hippo.constants import (
 )
 
 
+@cache
+def _expected_recency(days: int) -> float:
+    """Expected recency score after the given number of active days without access."""
+    return math.exp(-RECENCY_DECAY_RATE * days)
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestTemporalScoring:
     """Integration tests for temporal scoring through MCP server interface."""
     
-    def setup_method(self):
-        """Set up test environment for each test."""
-        self.storage = InMemoryStorage()
-        
-        # Create server with our in-memory storage directly
-        # No FileBasedStorage created, no threads, no cleanup needed
-        self.server = HippoServer(storage=self.storage)
-        
+    @pytest.fixture(autouse=True)
+    def fresh_server(self, server_factory):
+        """Give each test its own server and in-memory storage."""
+        # 💡: The factory shares one searcher across tests, which is the expensive part
+        self.server = server_factory()
+        self.storage = self.server.storage
         self.time_ctrl = TimeController(self.storage)
     
-    def teardown_method(self):
-        """Clean up after each test."""
-        # Use HippoServer's context manager exit for proper cleanup
-        self.server.__exit__(None, None, None)
-    
     async def create_insight(self, content: str, situation: list = None, importance: float = 0.8) -> str:
         """Helper to create insight and return UUID."""
         if situation is None:
@@ -45,7 +51,23 @@ class TestTemporalScoring:
         
         result = await self.server._record_insight(args)
         # Extract UUID from result text (format: "Created insight: uuid")
-        return result[0].text.split(": ")[1]
+        return result[0].text.partition(": ")[2]
+
+    async def create_insights(self, specs: list) -> list:
+        """Helper to create insights from (content, situation, importance) specs."""
+        # 💡: One active-day read and one storage write for the whole batch keeps large
+        # setups fast
+        current_active_day = await self.storage.get_current_active_day()
+        insights = [
+            Insight.create(
+                content=content,
+                situation=situation,
+                importance=importance,
+                current_active_day=current_active_day,
+            )
+            for content, situation, importance in specs
+        ]
+        return await self.storage.store_insights(insights)
     
     async def search_insights(self, query: str = "", situation_filter: list = None) -> Dict[str, Any]:
         """Helper to search insights and return parsed results."""
@@ -55,9 +77,7 @@ class TestTemporalScoring:
             "limit": {"offset": 0, "count": 10},
         }
         
-        result = await self.server._search_insights(args)
-        import json
-        return json.loads(result[0].text)
+        return await self.server._search_insights_raw(args)
     
     async def test_recency_decay_over_time(self):
         """Test that recency score decays exponentially over time."""
@@ -84,8 +104,8 @@ class TestTemporalScoring:
         # Verify exponential decay pattern
         # Expected recency at day 10: exp(-0.05 * 10) ≈ 0.606
         # Expected recency at day 20: exp(-0.05 * 20) ≈ 0.368
-        expected_recency_10 = math.exp(-RECENCY_DECAY_RATE * 10)
-        expected_recency_20 = math.exp(-RECENCY_DECAY_RATE * 20)
+        expected_recency_10 = _expected_recency(10)
+        expected_recency_20 = _expected_recency(20)
         
         print(f"Initial relevance: {initial_relevance:.3f}")
         print(f"Day 10 relevance: {day_10_relevance:.3f} (expected recency: {expected_recency_10:.3f})")
@@ -111,8 +131,9 @@ class TestTemporalScoring:
         results = await self.search_insights("frequency test")
         day_40_relevance = results["insights"][0]["relevance"]
         
-        # Access again on day 40 to create recent activity
-        await self.search_insights("frequency test")
+        # The search above already recorded a day 40 access (scores are computed before
+        # the access is recorded), so searching again shows the effect of recent
+        # activity
         results = await self.search_insights("frequency test")
         day_40_with_access_relevance = results["insights"][0]["relevance"]
         
@@ -123,6 +144,91 @@ class TestTemporalScoring:
         # Frequency should be higher when recent accesses are in the window
         assert day_40_with_access_relevance > day_40_relevance
     
+    async def test_search_accesses_are_flushed_to_storage(self):
+        """Test that accesses queued by searches reach storage when flushed."""
+        insight_uuid = UUID(await self.create_insight("flush test insight"))
+
+        self.time_ctrl.set_day(5)
+        await self.search_insights("flush test")
+
+        # The search queues the access for a background write rather than awaiting it
+        assert self.server._pending_accesses == [(insight_uuid, 5)]
+        insight = await self.storage.get_insight(insight_uuid)
+        day_5_before_flush = dict(insight.daily_access_counts).get(5, 0)
+
+        await self.server.flush_accesses()
+        assert self.server._pending_accesses == []
+        assert dict(insight.daily_access_counts)[5] == day_5_before_flush + 1
+
+    async def test_flushed_accesses_keep_their_search_day(self):
+        """Test that an access is counted on the day of the search, not of the flush."""
+        insight_uuid = UUID(await self.create_insight("search day test insight"))
+        insight = await self.storage.get_insight(insight_uuid)
+
+        self.time_ctrl.set_day(5)
+        await self.search_insights("search day test")
+        day_5_before_flush = dict(insight.daily_access_counts).get(5, 0)
+
+        self.time_ctrl.set_day(6)
+        await self.search_insights("search day test")
+        await self.server.flush_accesses()
+
+        counts = dict(insight.daily_access_counts)
+        assert counts[5] == day_5_before_flush + 1
+        assert [day for day, _ in insight.daily_access_counts] == sorted(counts)
+
+    async def test_failed_access_flush_is_requeued(self, monkeypatch):
+        """Test that accesses are kept for the next flush when writing them fails."""
+        insight_uuid = UUID(await self.create_insight("requeue test insight"))
+        await self.search_insights("requeue test")
+        queued = list(self.server._pending_accesses)
+
+        async def failing_record(storage, uuids, current_active_day=None):
+            raise OSError("disk full")
+
+        # Storage is a pydantic model, so patch the method on its class
+        monkeypatch.setattr(
+            type(self.storage), "record_insight_accesses", failing_record
+        )
+        with pytest.raises(OSError):
+            await self.server.flush_accesses()
+        assert self.server._pending_accesses == queued
+
+        monkeypatch.undo()
+        await self.server.flush_accesses()
+        assert self.server._pending_accesses == []
+        assert insight_uuid in {uuid for uuid, _ in queued}
+
+    async def test_search_response_serialization(self, monkeypatch, server_factory):
+        """Test the JSON text returned by the MCP search handler, not just the dict."""
+        # Enough results that the response is serialized on a worker thread
+        specs = [
+            (f"serialization test {n}", ["testing"], 0.5)
+            for n in range(SERIALIZE_IN_THREAD_MIN_RESULTS)
+        ]
+        uuids = await self.create_insights(specs)
+        limit = {"offset": 0, "count": SERIALIZE_IN_THREAD_MIN_RESULTS}
+        args = {"query": "", "limit": limit}
+
+        result = await self.server._search_insights(args)
+        assert "\n" in result[0].text  # Indented by default
+        parsed = json.loads(result[0].text)
+        assert parsed["returned_count"] == SERIALIZE_IN_THREAD_MIN_RESULTS
+        assert {insight["uuid"] for insight in parsed["insights"]} == set(uuids)
+
+        # Datetimes are rendered as ISO 8601 strings
+        first = parsed["insights"][0]
+        stored = await self.storage.get_insight(UUID(first["uuid"]))
+        assert datetime.fromisoformat(first["created_at"]) == stored.created_at
+
+        # Compact output holds the same data on a single line
+        monkeypatch.setenv("HIPPO_COMPACT_JSON", "1")
+        compact_server = server_factory(storage=self.storage)
+        compact_result = await compact_server._search_insights(args)
+        assert "\n" not in compact_result[0].text
+        compact_parsed = json.loads(compact_result[0].text)
+        assert {insight["uuid"] for insight in compact_parsed["insights"]} == set(uuids)
+
     async def test_reinforcement_learning(self):
         """Test upvote/downvote reinforcement effects."""
         # Create insight
@@ -176,10 +282,7 @@ class TestTemporalScoring:
             ("low importance recent", ["coding"], 0.3),
         ]
         
-        uuids = []
-        for content, situation, importance in insights:
-            uuid = await self.create_insight(content, situation, importance)
-            uuids.append(uuid)
+        uuids = await self.create_insights(insights)
         
         # Access some insights to create different recency/frequency patterns
         await self.search_insights("high importance")  # Access first insight
@@ -227,30 +330,3 @@ class TestTemporalScoring:
         # Distribution should match our manual calculation
         assert distribution == expected_distribution
 
-
-# Example of how to run tests
-async def run_tests():
-    """Run all temporal scoring tests."""
-    test_instance = TestTemporalScoring()
-    
-    tests = [
-        test_instance.test_recency_decay_over_time,
-        test_instance.test_frequency_calculation_with_window,
-        test_instance.test_reinforcement_learning,
-        test_instance.test_search_distribution_accuracy,
-    ]
-    
-    for test in tests:
-        print(f"\n=== Running {test.__name__} ===")
-        test_instance.setup_method()  # Fresh setup for each test
-        try:
-            await test()
-            print("✅ PASSED")
-        except Exception as e:
-            print(f"❌ FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-
-
-if __name__ == "__main__":
-    asyncio.run(run_tests())